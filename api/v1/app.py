@@ -6,12 +6,33 @@ Starts the Flask web API
 
 import os
 from flask import Flask, jsonify, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from models import storage
+from models.engine.json_codec import codec
 from api.v1.views import app_views
 
 
+class CodecJSONProvider(DefaultJSONProvider):
+    """ Encodes and decodes the JSON of the API with the codec of the
+    storage, falling back to the default provider for indented output """
+
+    def dumps(self, obj, **kwargs):
+        """ Returns the JSON document of obj. """
+        if "indent" in kwargs:
+            return super().dumps(obj, **kwargs)
+        return codec.dumps(obj, kwargs.get("sort_keys", self.sort_keys),
+                           self.default)
+
+    def loads(self, s, **kwargs):
+        """ Returns the object of a JSON document. """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return codec.loads(s)
+
+
 app = Flask('__main__')
+app.json = CodecJSONProvider(app)
 app.url_map.strict_slashes = False
 app.register_blueprint(app_views)
 CORS(app, resources={r"/*": {"origins": "0.0.0.0"}})
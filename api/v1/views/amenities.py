@@ -6,6 +6,8 @@ from flask import jsonify, request, abort
 from models import storage
 from models.amenity import Amenity
 from api.v1.views import app_views
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/amenities', methods=['GET'])
@@ -13,9 +15,7 @@ def amenities():
     """
     Lists all the Amenity instances.
     """
-    all_amenities = [Amenity.to_dict(obj) for obj in
-                     storage.all("Amenity").values()]
-    return jsonify(all_amenities)
+    return collection("Amenity")
 
 
 @app_views.route('/amenities/<amenity_id>', methods=['GET'])
@@ -30,7 +30,7 @@ def get_amenity(amenity_id):
     amenity = storage.get("Amenity", amenity_id)
     if not amenity:
         abort(404, "Not found")
-    return jsonify(amenity.to_dict())
+    return resource(amenity)
 
 
 @app_views.route('/amenities', methods=['POST'])
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+
+"""
+Defines how the API batch endpoints create their instances.
+
+A batch is a JSON array of the objects the single-instance endpoint would
+accept. The whole array is validated first, each referenced instance being
+looked up once however many objects reference it, then every instance is
+created and saved at once with storage.bulk_new(). If any object of the
+batch is invalid, nothing is created.
+"""
+
+from flask import jsonify, request, abort
+from models import storage
+
+
+def create_batch(cls, required, references, **parents):
+    """
+    Returns the 201 response holding the cls instances created from the
+    JSON array of the request, with the given parents attributes.
+
+    If the request doesn't contain a non-empty JSON array of objects, the
+    function will return a 400 response.
+
+    If an object doesn't contain one of the required entries, the function
+    will return a 400 response.
+
+    If an object references an instance that doesn't exist, the function
+    will return a 404 response.
+
+    Arguments:
+        cls (class): class of the instances to create
+        required (tuple): entries every object must contain
+        references (dict): class name of the instance referenced by each
+            entry holding an ID
+        parents (dict): attributes set on every instance
+    """
+    items = request.get_json()
+    if not isinstance(items, list) or not items:
+        abort(400, "Not a JSON array")
+    if not all(isinstance(item, dict) for item in items):
+        abort(400, "Not a JSON array")
+
+    for name in required:
+        if any(name not in item for item in items):
+            abort(400, "Missing " + name)
+
+    for name, referenced in references.items():
+        ids = {str(item[name]) for item in items if name in item}
+        for id in ids:
+            if not storage.get(referenced, id):
+                abort(404, "Not found")
+
+    objs = [cls(**dict(item, **parents)) for item in items]
+    storage.bulk_new(objs)
+
+    return jsonify([obj.to_dict() for obj in objs]), 201
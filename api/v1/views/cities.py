@@ -8,6 +8,8 @@ from flask import jsonify, request, abort
 from models import storage
 from models.city import City
 from api.v1.views import app_views
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/states/<state_id>/cities', methods=['GET'])
@@ -22,10 +24,7 @@ def cities(state_id):
     if not storage.get("State", state_id):
         abort(404, "Not found")
 
-    all_cities = list(
-        filter(lambda city: city["state_id"] == state_id,
-               [City.to_dict(city) for city in storage.all("City").values()]))
-    return jsonify(all_cities)
+    return collection("City", state_id=state_id)
 
 
 @app_views.route('/cities/<id>', methods=['GET'])
@@ -40,7 +39,7 @@ def get_city(id):
     city = storage.get("City", id)
     if not city:
         abort(404, "Not found")
-    return jsonify(city.to_dict())
+    return resource(city)
 
 
 @app_views.route('/states/<state_id>/cities', methods=['POST'])
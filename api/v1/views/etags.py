@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+"""
+Defines the ETags of the API responses and how conditional GET requests
+are answered.
+
+The ETag of an instance is derived from its id and updated_at, the ETag of
+a collection from the storage version of its class. A GET request whose
+If-None-Match header holds the current ETag is answered with an empty 304
+response, without serializing anything.
+"""
+
+from hashlib import sha1
+from flask import jsonify, request, Response
+from models import storage
+from models.base_model import format_time
+
+
+def object_etag(obj):
+    """
+    Returns the ETag of an instance.
+    """
+    version = obj.id + " " + format_time(obj.updated_at)
+    return sha1(version.encode()).hexdigest()
+
+
+def collection_etag(cls, **equalities):
+    """
+    Returns the ETag of the collection of the cls instances whose
+    attributes are equal to the given values.
+    """
+    version = storage.version(cls, **equalities)
+    return sha1(version.encode()).hexdigest()
+
+
+def conditional(etag, build):
+    """
+    Returns a 304 response if the request already holds the given ETag,
+    the response returned by build() otherwise, tagged with the ETag.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    return response
+
+
+def resource(obj):
+    """
+    Returns the conditional response holding an instance.
+    """
+    return conditional(object_etag(obj), lambda: jsonify(obj.to_dict()))
@@ -25,11 +25,22 @@ def retrieve_number():
     """
     Endpoint that retrieves the number of each objects by type
     """
+    counts = storage.counts(["Amenity", "City", "Place", "Review", "State",
+                             "User"])
     return make_response(jsonify({
-        "amenities": storage.count("Amenity"),
-        "cities": storage.count("City"),
-        "places": storage.count("Place"),
-        "reviews": storage.count("Review"),
-        "states": storage.count("State"),
-        "users": storage.count("User")
+        "amenities": counts["Amenity"],
+        "cities": counts["City"],
+        "places": counts["Place"],
+        "reviews": counts["Review"],
+        "states": counts["State"],
+        "users": counts["User"]
     }))
+
+
+@app_views.route('/metrics')
+def metrics():
+    """
+    Endpoint that retrieves the counters of the storage, such as the cache
+    hits or the connection pool usage in DB mode
+    """
+    return make_response(jsonify(storage.metrics()))
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+
+"""
+Defines how the API collection endpoints list their instances.
+
+A page is requested with the "limit" and "cursor" query parameters. The
+cursor of the next page, if any, is sent back in the X-Next-Cursor header.
+When HBNB_API_PAGE_SIZE is set, it is the limit used by default.
+
+Without a limit, the whole collection is streamed as a JSON array, built
+incrementally from storage.iter() instead of being held in memory.
+
+Either way the response is tagged with the ETag of the collection, and a
+request already holding it is answered with a 304 response.
+"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+from os import getenv
+from flask import jsonify, json, request, abort, Response
+from flask import stream_with_context
+from models import storage
+from api.v1.views.etags import collection_etag, conditional
+from models.base_model import format_time, parse_time
+
+# number of instances serialized into each chunk of a streamed response
+CHUNK_SIZE = 100
+
+
+def encode_cursor(obj):
+    """
+    Returns the opaque cursor pointing right after obj.
+    """
+    position = format_time(obj.created_at) + " " + obj.id
+    return urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Returns the (created_at, id) position of a cursor.
+
+    Raises a ValueError if the cursor is malformed.
+    """
+    try:
+        position = urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError):
+        raise ValueError("invalid cursor")
+    created_at, _, id = position.partition(" ")
+    return parse_time(created_at), id
+
+
+def paginate(cls, **equalities):
+    """
+    Returns the response holding a page of the cls instances whose
+    attributes are equal to the given values, or None if the request
+    does not ask for a page.
+
+    If the limit or the cursor are invalid, the function will return a
+    400 response.
+    """
+    limit = request.args.get("limit", getenv("HBNB_API_PAGE_SIZE"))
+    cursor = request.args.get("cursor")
+    if limit is None and cursor is None:
+        return None
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+        if limit is not None:
+            limit = int(limit)
+            if limit < 1:
+                raise ValueError("invalid limit")
+    except ValueError:
+        abort(400, "Invalid limit or cursor")
+
+    objs = storage.page(cls, limit + 1 if limit else None, after,
+                        **equalities)
+    response = jsonify([obj.to_dict() for obj in objs[:limit]])
+    if limit and len(objs) > limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(objs[limit - 1])
+    return response
+
+
+def stream(cls, **equalities):
+    """
+    Returns a response streaming the JSON array of the cls instances whose
+    attributes are equal to the given values.
+    """
+    def generate():
+        """yields the JSON array by chunks of CHUNK_SIZE instances"""
+        chunk = ["["]
+        for count, obj in enumerate(storage.iter(cls, **equalities)):
+            chunk.append(("," if count else "") + json.dumps(obj.to_dict()))
+            if len(chunk) >= CHUNK_SIZE:
+                yield "".join(chunk)
+                chunk = []
+        chunk.append("]\n")
+        yield "".join(chunk)
+
+    return Response(stream_with_context(generate()),
+                    mimetype="application/json")
+
+
+def collection(cls, **equalities):
+    """
+    Returns the response listing the cls instances whose attributes are
+    equal to the given values: a page of them if the request asks for one,
+    all of them streamed otherwise.
+    """
+    def build():
+        """builds the listing once the ETag did not match"""
+        response = paginate(cls, **equalities)
+        if response is None:
+            response = stream(cls, **equalities)
+        return response
+
+    return conditional(collection_etag(cls, **equalities), build)
@@ -8,6 +8,9 @@ from flask import jsonify, request, abort
 from models import storage
 from models.place import Place
 from api.v1.views import app_views
+from api.v1.views.batch import create_batch
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/cities/<city_id>/places', methods=['GET'])
@@ -22,11 +25,7 @@ def places(city_id):
     if not storage.get("City", city_id):
         abort(404, "Not found")
 
-    all_places = list(
-        filter(lambda place: place["city_id"] == city_id,
-               [Place.to_dict(place) for place in
-                storage.all("Place").values()]))
-    return jsonify(all_places)
+    return collection("Place", city_id=city_id)
 
 
 @app_views.route('/places/<id>', methods=['GET'])
@@ -41,7 +40,7 @@ def get_place(id):
     place = storage.get("Place", id)
     if not place:
         abort(404, "Not found")
-    return jsonify(place.to_dict())
+    return resource(place)
 
 
 @app_views.route('/cities/<city_id>/places', methods=['POST'])
@@ -81,6 +80,24 @@ def create_place(city_id):
     return jsonify(place.to_dict()), 201
 
 
+@app_views.route('/cities/<city_id>/places:batch', methods=['POST'])
+def create_places(city_id):
+    """
+    Creates the Place instances of a JSON array in a single save.
+
+    If an object doesn't contain a "name" or "user_id" entry, the function
+    will return a 400 response and no Place is created.
+
+    Arguments:
+        city_id (str): City ID
+    """
+    if not storage.get("City", city_id):
+        abort(404, "Not found")
+
+    return create_batch(Place, ("user_id", "name"), {"user_id": "User"},
+                        city_id=city_id)
+
+
 @app_views.route('/places/<id>', methods=['PUT'])
 def update_place(id):
     """
@@ -6,6 +6,9 @@ from flask import jsonify, request, abort
 from models import storage
 from models.review import Review
 from api.v1.views import app_views
+from api.v1.views.batch import create_batch
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/places/<place_id>/reviews', methods=['GET'])
@@ -20,11 +23,7 @@ def reviews(place_id):
     if not storage.get("Place", place_id):
         abort(404, "Not found")
 
-    all_reviews = list(
-        filter(lambda review: review["place_id"] == place_id,
-               [Review.to_dict(review) for review in
-                storage.all("Review").values()]))
-    return jsonify(all_reviews)
+    return collection("Review", place_id=place_id)
 
 
 @app_views.route('/reviews/<id>', methods=['GET'])
@@ -39,7 +38,7 @@ def get_review(id):
     review = storage.get("Review", id)
     if not review:
         abort(404, "Not found")
-    return jsonify(review.to_dict())
+    return resource(review)
 
 
 @app_views.route('/places/<place_id>/reviews', methods=['POST'])
@@ -78,6 +77,24 @@ def create_review(place_id):
     return jsonify(review.to_dict()), 201
 
 
+@app_views.route('/places/<place_id>/reviews:batch', methods=['POST'])
+def create_reviews(place_id):
+    """
+    Creates the Review instances of a JSON array in a single save.
+
+    If an object doesn't contain a "user_id" or "text" entry, the function
+    will return a 400 response and no Review is created.
+
+    Arguments:
+        place_id (str): Place ID
+    """
+    if not storage.get("Place", place_id):
+        abort(404, "Not found")
+
+    return create_batch(Review, ("user_id", "text"), {"user_id": "User"},
+                        place_id=place_id)
+
+
 @app_views.route('/reviews/<id>', methods=['PUT'])
 def update_review(id):
     """
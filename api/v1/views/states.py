@@ -8,6 +8,8 @@ from flask import jsonify, request, abort
 from models import storage
 from models.state import State
 from api.v1.views import app_views
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/states', methods=['GET'])
@@ -15,9 +17,7 @@ def states():
     """
     Lists all the State instances.
     """
-    all_states = [State.to_dict(obj) for obj in
-                  storage.all("State").values()]
-    return jsonify(all_states)
+    return collection("State")
 
 
 @app_views.route('/states/<id>', methods=['GET'])
@@ -32,7 +32,7 @@ def get_state(id):
     state = storage.get("State", id)
     if not state:
         abort(404, "Not found")
-    return jsonify(state.to_dict())
+    return resource(state)
 
 
 @app_views.route('/states', methods=['POST'])
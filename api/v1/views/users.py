@@ -8,6 +8,8 @@ from flask import jsonify, request, abort
 from models import storage
 from models.user import User
 from api.v1.views import app_views
+from api.v1.views.etags import resource
+from api.v1.views.listing import collection
 
 
 @app_views.route('/users', methods=['GET'])
@@ -15,8 +17,7 @@ def users():
     """
     Lists all the User instances.
     """
-    all_users = [User.to_dict(user) for user in storage.all("User").values()]
-    return jsonify(all_users)
+    return collection("User")
 
 
 @app_views.route('/users/<id>', methods=['GET'])
@@ -31,7 +32,7 @@ def get_user(id):
     user = storage.get("User", id)
     if not user:
         abort(404, "Not found")
-    return jsonify(user.to_dict())
+    return resource(user)
 
 
 @app_views.route('/users', methods=['POST'])
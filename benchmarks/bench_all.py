@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Measures storage.all(cls) and storage.count(cls) on a mixed-class store.
+
+Usage: ./benchmarks/bench_all.py [total_objects]
+
+The store is filled with a skewed mix of classes (many reviews and places,
+few states and amenities), then the mean time of all(cls) and count(cls)
+is printed per class, together with the six counts of /api/v1/stats.
+"""
+
+import sys
+import timeit
+from common import scratch_storage
+
+# share of the total objects given to each class
+MIX = {"Review": 0.55, "Place": 0.2, "User": 0.15, "City": 0.08,
+       "Amenity": 0.015, "State": 0.005}
+
+
+def main(total=200000):
+    """runs the benchmark on a store of total objects"""
+    storage = scratch_storage()
+    from models.engine.file_storage import classes
+    for name, share in MIX.items():
+        for i in range(int(total * share)):
+            storage.new(classes[name]())
+    print("{:>8}  {:>8}  {:>14}  {:>14}".format(
+        "class", "objects", "all(cls) usec", "count(cls) usec"))
+    for name in MIX:
+        loops = 20
+        all_time = timeit.timeit(lambda: storage.all(name), number=loops)
+        count_time = timeit.timeit(lambda: storage.count(name), number=loops)
+        print("{:>8}  {:>8}  {:>14.1f}  {:>14.1f}".format(
+            name, storage.count(name), all_time / loops * 1e6,
+            count_time / loops * 1e6))
+    loops = 100
+    stats = timeit.timeit(lambda: [storage.count(name) for name in MIX],
+                          number=loops)
+    print("stats (6 counts): {:.1f} usec".format(stats / loops * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+Measures the throughput of creating objects one save at a time and with
+storage.bulk_new().
+
+Usage: ./benchmarks/bench_bulk.py [batch_size] [single_objects]
+
+single_objects places are created with one BaseModel.save() each, then
+batches of batch_size places are created with one storage.bulk_new() each,
+and the number of objects created per second is printed for both.
+"""
+
+import sys
+import time
+from common import scratch_storage
+
+
+def main(batch_size=10000, single_objects=1000):
+    """runs the benchmark with batches of batch_size objects"""
+    storage = scratch_storage()
+    from models.city import City
+    from models.place import Place
+    from models.state import State
+    from models.user import User
+    state = State(name="bench")
+    state.save()
+    city = City(name="bench", state_id=state.id)
+    city.save()
+    user = User(email="bench", password="bench")
+    user.save()
+    attributes = {"name": "bench", "number_rooms": 2,
+                  "city_id": city.id, "user_id": user.id}
+    print("{:>10}  {:>10}  {:>14}".format("path", "objects", "objects/sec"))
+    start = time.perf_counter()
+    for i in range(single_objects):
+        Place(**attributes).save()
+    elapsed = time.perf_counter() - start
+    print("{:>10}  {:>10}  {:>14.0f}".format(
+        "save", single_objects, single_objects / elapsed))
+    for batch in range(3):
+        places = [Place(**attributes) for i in range(batch_size)]
+        start = time.perf_counter()
+        storage.bulk_new(places)
+        elapsed = time.perf_counter() - start
+        print("{:>10}  {:>10}  {:>14.0f}".format(
+            "bulk_new", batch_size, batch_size / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+"""
+Measures the latency of storage.get() as the store grows.
+
+Usage: ./benchmarks/bench_get.py [max_objects]
+
+The store is grown in steps of x10 starting at 1000 objects and the mean
+time of a get() by primary key is printed for each step.
+"""
+
+import random
+import sys
+import timeit
+from common import scratch_storage
+
+
+def main(max_objects=1000000):
+    """runs the benchmark up to max_objects objects"""
+    storage = scratch_storage()
+    from models.state import State
+    ids = []
+    size = 1000
+    print("{:>10}  {:>12}".format("objects", "get (usec)"))
+    while size <= max_objects:
+        while len(ids) < size:
+            state = State(name="bench")
+            storage.new(state)
+            ids.append(state.id)
+        sample = random.sample(ids, 1000)
+        loops = 100
+        total = timeit.timeit(
+            lambda: [storage.get("State", i) for i in sample], number=loops)
+        print("{:>10}  {:>12.3f}".format(
+            size, total / (loops * len(sample)) * 1e6))
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
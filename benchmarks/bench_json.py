@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+Measures the JSON codecs on a large store and on a large list response.
+
+Usage: ./benchmarks/bench_json.py [objects]
+
+For each installed backend the time of a FileStorage.save() rewriting the
+whole file, of a FileStorage.reload() and of the encoding of the list of
+all the objects by the API JSON provider is printed.
+"""
+
+import sys
+import timeit
+from common import scratch_storage
+
+
+def main(objects=100000):
+    """runs the benchmark with a store of the given number of objects"""
+    storage = scratch_storage()
+    from models.engine import file_storage, json_codec
+    from models.place import Place
+    from api.v1.app import app
+    for i in range(objects):
+        storage.new(Place(name="bench {}".format(i), number_rooms=i % 7,
+                          latitude=37.77, description="x" * 40))
+    records = [obj.to_dict() for obj in storage.all().values()]
+    storage.save()
+    print("{:>8}  {:>12}  {:>14}  {:>12}".format(
+        "codec", "save (msec)", "reload (msec)", "list (msec)"))
+    for backend in json_codec.backends:
+        try:
+            codec = json_codec.JSONCodec(backend)
+        except ImportError:
+            continue
+        file_storage.codec = sys.modules["api.v1.app"].codec = codec
+        result = [backend]
+        loops = 3
+        for run in (storage.save, storage.reload,
+                    lambda: app.json.dumps(records)):
+            result.append(timeit.timeit(run, number=loops) / loops * 1e3)
+        print("{:>8}  {:>12.1f}  {:>14.1f}  {:>12.1f}".format(*result))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+Measures the startup cost of FileStorage.reload() on a large file.
+
+Usage: ./benchmarks/bench_reload.py [objects]
+
+A file.json of the given number of places is written, then the time of
+reload(), of a first get() and of instantiating every object with all()
+is printed.
+"""
+
+import random
+import sys
+import time
+from common import scratch_storage
+
+
+def main(objects=1000000):
+    """runs the benchmark on a file of the given number of objects"""
+    storage = scratch_storage()
+    from models.engine.json_codec import codec
+    from models.place import Place
+    records = {}
+    for i in range(objects):
+        place = Place(name="bench {}".format(i), number_rooms=i % 7,
+                      city_id="city {}".format(i % 1000))
+        records["Place." + place.id] = place.to_dict()
+    with open("file.json", "wb") as f:
+        f.write(codec.dumpb(records))
+    ids = [key.partition(".")[2] for key in records]
+    del records
+    for name, run in (("reload", storage.reload),
+                      ("get", lambda: storage.get(Place,
+                                                  random.choice(ids))),
+                      ("all", storage.all)):
+        start = time.perf_counter()
+        run()
+        print("{:>8}  {:>12.1f} msec".format(
+            name, (time.perf_counter() - start) * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+Measures the rendering time of /cities_by_states as the data grows.
+
+Usage: ./benchmarks/bench_render.py [max_states]
+
+Each step holds 100 cities per state, up to max_states states (1000 states
+and 100000 cities by default), and the page of web_flask/8-cities_by_states
+is rendered through the Flask test client.
+"""
+
+import importlib
+import sys
+import time
+from common import scratch_storage
+
+
+def main(max_states=1000):
+    """runs the benchmark up to max_states states"""
+    storage = scratch_storage()
+    from models.city import City
+    from models.state import State
+    app = importlib.import_module("web_flask.8-cities_by_states").app
+    client = app.test_client()
+    states = 0
+    size = 10
+    print("{:>8}  {:>8}  {:>12}".format("states", "cities", "render (ms)"))
+    while size <= max_states:
+        while states < size:
+            state = State(name="state {}".format(states))
+            storage.new(state)
+            for i in range(100):
+                storage.new(City(name="city {}".format(i), state_id=state.id))
+            states += 1
+        start = time.perf_counter()
+        client.get("/cities_by_states")
+        print("{:>8}  {:>8}  {:>12.1f}".format(
+            size, storage.count("City"), (time.perf_counter() - start) * 1e3))
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+Measures the cost of saving one changed object as the store grows.
+
+Usage: ./benchmarks/bench_save.py [max_objects]
+
+For each store size the mean time of a BaseModel.save() on a single object
+is printed with the full rewrite of file.json, with the journal
+(HBNB_FILE_JOURNAL=1) and with the background writer (HBNB_FILE_ASYNC=1),
+whose saves return before file.json is rewritten.
+"""
+
+import random
+import sys
+import timeit
+from common import scratch_storage
+
+
+def main(max_objects=100000):
+    """runs the benchmark up to max_objects objects"""
+    storage = scratch_storage()
+    from models.engine.file_storage import FileStorage
+    from models.place import Place
+    places = []
+    size = 1000
+    print("{:>10}  {:>12}  {:>14}  {:>12}".format(
+        "objects", "full (msec)", "journal (msec)", "async (msec)"))
+    while size <= max_objects:
+        while len(places) < size:
+            place = Place(name="bench", number_rooms=2)
+            storage.new(place)
+            places.append(place)
+        result = [size]
+        for journal, async_ in ((False, False), (True, False),
+                                (False, True)):
+            FileStorage._FileStorage__journal = journal
+            FileStorage._FileStorage__async = async_
+            storage.save()
+            storage.flush()
+            loops = 20
+            total = timeit.timeit(lambda: random.choice(places).save(),
+                                  number=loops)
+            result.append(total / loops * 1e3)
+            storage.flush()
+        print("{:>10}  {:>12.3f}  {:>14.3f}  {:>12.3f}".format(*result))
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+Measures the parsing and formatting of the created_at/updated_at strings.
+
+Usage: ./benchmarks/bench_time.py [timestamps]
+
+The given number of timestamps is parsed and formatted with strptime and
+strftime, then with parse_time and format_time of models.base_model, and
+the total time of each is printed with the speedup.
+"""
+
+from datetime import datetime, timedelta
+import sys
+import time
+from common import scratch_storage
+
+
+def main(timestamps=1000000):
+    """runs the benchmark on the given number of timestamps"""
+    scratch_storage()
+    from models.base_model import format_time, parse_time, time as fmt
+    start = datetime(2017, 1, 1)
+    values = [start + timedelta(microseconds=i * 7919)
+              for i in range(timestamps)]
+    strings = [value.strftime(fmt) for value in values]
+    print("{:>8}  {:>12}  {:>12}  {:>8}".format(
+        "", "stdlib (s)", "fast (s)", "speedup"))
+    for name, slow, fast, data in (
+            ("parse", lambda s: datetime.strptime(s, fmt), parse_time,
+             strings),
+            ("format", lambda v: v.strftime(fmt), format_time, values)):
+        result = []
+        for run in (slow, fast):
+            begin = time.perf_counter()
+            for item in data:
+                run(item)
+            result.append(time.perf_counter() - begin)
+        print("{:>8}  {:>12.3f}  {:>12.3f}  {:>7.1f}x".format(
+            name, result[0], result[1], result[0] / result[1]))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""
+Helpers shared by the benchmark scripts
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def scratch_storage():
+    """moves to an empty directory and returns the storage loaded from it,
+    so the benchmarks never touch the project's own file.json"""
+    os.chdir(tempfile.mkdtemp())
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    from models import storage
+    return storage
@@ -7,6 +7,7 @@ import models
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.json_codec import codec
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -77,9 +78,9 @@ class HBNBCommand(cmd.Cmd):
             return False
         if args[0] in classes:
             if len(args) > 1:
-                key = args[0] + "." + args[1]
-                if key in models.storage.all():
-                    print(models.storage.all()[key])
+                obj = models.storage.get(args[0], args[1])
+                if obj is not None:
+                    print(obj)
                 else:
                     print("** no instance found **")
             else:
@@ -94,9 +95,9 @@ class HBNBCommand(cmd.Cmd):
             print("** class name missing **")
         elif args[0] in classes:
             if len(args) > 1:
-                key = args[0] + "." + args[1]
-                if key in models.storage.all():
-                    models.storage.all().pop(key)
+                obj = models.storage.get(args[0], args[1])
+                if obj is not None:
+                    models.storage.delete(obj)
                     models.storage.save()
                 else:
                     print("** no instance found **")
@@ -132,8 +133,8 @@ class HBNBCommand(cmd.Cmd):
             print("** class name missing **")
         elif args[0] in classes:
             if len(args) > 1:
-                k = args[0] + "." + args[1]
-                if k in models.storage.all():
+                obj = models.storage.get(args[0], args[1])
+                if obj is not None:
                     if len(args) > 2:
                         if len(args) > 3:
                             if args[0] == "Place":
@@ -147,8 +148,8 @@ class HBNBCommand(cmd.Cmd):
                                         args[3] = float(args[3])
                                     except:
                                         args[3] = 0.0
-                            setattr(models.storage.all()[k], args[2], args[3])
-                            models.storage.all()[k].save()
+                            setattr(obj, args[2], args[3])
+                            obj.save()
                         else:
                             print("** value missing **")
                     else:
@@ -160,5 +161,110 @@ class HBNBCommand(cmd.Cmd):
         else:
             print("** class doesn't exist **")
 
+    def _class_and_file(self, arg):
+        """returns the class and the file name given in arg, None if one of
+        them is missing or invalid"""
+        args = shlex.split(arg)
+        if len(args) == 0:
+            print("** class name missing **")
+        elif args[0] not in classes:
+            print("** class doesn't exist **")
+        elif len(args) == 1:
+            print("** file name missing **")
+        else:
+            return classes[args[0]], args[1]
+        return None
+
+    def _missing_column(self, obj):
+        """returns the name of a column that obj must hold to be saved to
+        the database but does not, None if there is none"""
+        table = getattr(obj.__class__, "__table__", None)
+        if table is None:
+            return None
+        for column in table.columns:
+            if (not column.nullable and column.default is None and
+                    column.server_default is None and
+                    getattr(obj, column.name, None) is None):
+                return column.name
+        return None
+
+    def _instances(self, cls, file_name):
+        """yields an instance of cls for each line of a file holding one
+        JSON object per line
+
+        Raises a ValueError holding the line to print if a record is
+        invalid and an OSError if the file can't be read.
+        """
+        with open(file_name, "rb") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = codec.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("not an object")
+                    record.pop("__class__", None)
+                    obj = cls(**record)
+                except ValueError:
+                    raise ValueError("** invalid record on line {} **"
+                                     .format(number)) from None
+                missing = self._missing_column(obj)
+                if missing is not None:
+                    raise ValueError("** {} missing on line {} **"
+                                     .format(missing, number))
+                yield obj
+
+    def do_import(self, arg):
+        """Creates the instances of a class from a file holding one JSON
+        object per line, all saved at once
+
+        The file is read twice: first to check every record, so that
+        nothing is created if one of them is invalid, then to add the
+        instances to the storage one at a time before a single save.
+        """
+        parsed = self._class_and_file(arg)
+        if parsed is None:
+            return False
+        cls, file_name = parsed
+        count = 0
+        try:
+            for obj in self._instances(cls, file_name):
+                pass
+            for obj in self._instances(cls, file_name):
+                models.storage.new(obj)
+                count += 1
+        except ValueError as error:
+            print(error)
+            return False
+        except OSError:
+            print("** file can't be read **")
+            return False
+        if count:
+            try:
+                models.storage.save()
+            except Exception:
+                print("** records can't be saved **")
+                return False
+        print(count)
+
+    def do_export(self, arg):
+        """Writes the instances of a class to a file, one JSON object per
+        line"""
+        parsed = self._class_and_file(arg)
+        if parsed is None:
+            return False
+        cls, file_name = parsed
+        count = 0
+        try:
+            with open(file_name, "wb") as f:
+                for obj in models.storage.iter(cls):
+                    f.write(codec.dumpb(obj.to_dict()) + b"\n")
+                    count += 1
+        except OSError:
+            print("** file can't be written **")
+            return False
+        print(count)
+
+
 if __name__ == '__main__':
     HBNBCommand().cmdloop()
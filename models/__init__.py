@@ -8,10 +8,18 @@ from os import getenv
 
 storage_t = getenv("HBNB_TYPE_STORAGE")
 
-if storage_t == "db":
+if storage_t == "sqlite":
+    # the models are mapped to the SQLite database as to the MySQL one, so
+    # the rest of the code only distinguishes "db" from the file storage
+    storage_t = "db"
+    from models.engine.sqlite_storage import SQLiteStorage
+    storage = SQLiteStorage()
+elif storage_t == "db":
     from models.engine.db_storage import DBStorage
     storage = DBStorage()
 else:
     from models.engine.file_storage import FileStorage
     storage = FileStorage()
-storage.reload()
+# the file storage reads its files on first use instead, see FileStorage
+if storage_t == "db":
+    storage.reload()
@@ -6,15 +6,43 @@ Contains class BaseModel
 from datetime import datetime
 import models
 from os import getenv
-import sqlalchemy
-from sqlalchemy import Column, String, DateTime
-from sqlalchemy.ext.declarative import declarative_base
 import uuid
+if models.storage_t == "db":
+    from sqlalchemy import Column, String, DateTime
+    from sqlalchemy.dialects.mysql import DATETIME
+    from sqlalchemy.ext.declarative import declarative_base
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
 
+
+def parse_time(value):
+    """returns the datetime of a string in the time format, read by
+    datetime.fromisoformat() when it has the exact shape written by
+    format_time() and by datetime.strptime() otherwise
+
+    Raises a ValueError if the string is not in the time format.
+    """
+    if (len(value) == 26 and value[4] == value[7] == "-" and
+            value[10] == "T" and value[13] == value[16] == ":" and
+            value[19] == "." and value[20:].isdigit()):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, time)
+
+
+def format_time(value):
+    """returns the string of a datetime in the time format, written by
+    datetime.isoformat() for the naive datetimes it renders identically
+    and by datetime.strftime() otherwise"""
+    if value.tzinfo is None and value.year >= 1000:
+        return value.isoformat(timespec="microseconds")
+    return value.strftime(time)
+
+
 if models.storage_t == "db":
     Base = declarative_base()
+    # MySQL keeps the microseconds of the timestamps, which the versions of
+    # the collections and the cursors of the pages rely on
+    Timestamp = DateTime().with_variant(DATETIME(fsp=6), "mysql")
 else:
     Base = object
 
@@ -23,29 +51,37 @@ class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
-        created_at = Column(DateTime, default=datetime.utcnow)
-        updated_at = Column(DateTime, default=datetime.utcnow)
+        created_at = Column(Timestamp, default=datetime.utcnow)
+        updated_at = Column(Timestamp, default=datetime.utcnow)
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
+        # a new instance is not in the storage yet, so its attributes are
+        # set without going through __setattr__
+        set_attr = super().__setattr__
         if kwargs:
             for key, value in kwargs.items():
                 if key != "__class__":
-                    setattr(self, key, value)
+                    set_attr(key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
-                self.created_at = datetime.strptime(kwargs["created_at"], time)
+                set_attr("created_at", parse_time(kwargs["created_at"]))
             else:
-                self.created_at = datetime.utcnow()
+                set_attr("created_at", datetime.utcnow())
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(kwargs["updated_at"], time)
+                set_attr("updated_at", parse_time(kwargs["updated_at"]))
             else:
-                self.updated_at = datetime.utcnow()
+                set_attr("updated_at", datetime.utcnow())
             if kwargs.get("id", None) is None:
-                self.id = str(uuid.uuid4())
+                set_attr("id", str(uuid.uuid4()))
         else:
-            self.id = str(uuid.uuid4())
-            self.created_at = datetime.utcnow()
-            self.updated_at = self.created_at
+            set_attr("id", str(uuid.uuid4()))
+            set_attr("created_at", datetime.utcnow())
+            set_attr("updated_at", self.created_at)
+
+    def __setattr__(self, name, value):
+        """sets an attribute and flags the instance as changed"""
+        super().__setattr__(name, value)
+        models.storage.touch(self)
 
     def __str__(self):
         """String representation of the BaseModel class"""
@@ -62,9 +98,9 @@ class BaseModel:
         """returns a dictionary containing all keys/values of the instance"""
         new_dict = self.__dict__.copy()
         if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            new_dict["created_at"] = format_time(new_dict["created_at"])
         if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["updated_at"] = format_time(new_dict["updated_at"])
         new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
@@ -4,11 +4,15 @@ Contains the class DBStorage
 """
 
 from os import getenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import and_, create_engine, func, or_
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
 from models.city import City
+from models.engine.lru_cache import LRUCache
+from models.engine.timed_pool import TimedQueuePool
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -19,24 +23,49 @@ classes = {"Amenity": Amenity, "City": City,
 
 
 class DBStorage:
-    """interaacts with the MySQL database"""
+    """interaacts with the MySQL database
+
+    The connection pool is configured by HBNB_MYSQL_POOL_SIZE,
+    HBNB_MYSQL_POOL_MAX_OVERFLOW, HBNB_MYSQL_POOL_TIMEOUT (seconds to wait
+    for a connection), HBNB_MYSQL_POOL_RECYCLE (seconds after which a
+    connection is replaced, kept below the MySQL wait_timeout) and
+    HBNB_MYSQL_POOL_PRE_PING (1 to test each connection before using it,
+    0 to skip the test).
+    """
     __engine = None
     __session = None
+    # LRUCache - serialized objects by <class name>.id, shared by the whole
+    # process and read by get() before querying the database
+    # (HBNB_DB_CACHE_SIZE entries, 0 to disable it); the changes committed
+    # by other processes are seen once the entries expire, after
+    # HBNB_DB_CACHE_TTL seconds (0 to keep them until evicted)
+    __cache = LRUCache(int(getenv("HBNB_DB_CACHE_SIZE", "10000")),
+                       float(getenv("HBNB_DB_CACHE_TTL", "60")))
 
     def __init__(self):
         """Instantiate a DBStorage object"""
+        HBNB_ENV = getenv('HBNB_ENV')
+        self.__engine = self._create_engine()
+        if HBNB_ENV == "test":
+            Base.metadata.drop_all(self.__engine)
+
+    def _create_engine(self):
+        """returns the engine connected to the MySQL database"""
         HBNB_MYSQL_USER = getenv('HBNB_MYSQL_USER')
         HBNB_MYSQL_PWD = getenv('HBNB_MYSQL_PWD')
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
-        HBNB_ENV = getenv('HBNB_ENV')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
-                                      format(HBNB_MYSQL_USER,
-                                             HBNB_MYSQL_PWD,
-                                             HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
-        if HBNB_ENV == "test":
-            Base.metadata.drop_all(self.__engine)
+        return create_engine(
+            'mysql+mysqldb://{}:{}@{}/{}'.format(HBNB_MYSQL_USER,
+                                                 HBNB_MYSQL_PWD,
+                                                 HBNB_MYSQL_HOST,
+                                                 HBNB_MYSQL_DB),
+            poolclass=TimedQueuePool,
+            pool_size=int(getenv('HBNB_MYSQL_POOL_SIZE', '5')),
+            max_overflow=int(getenv('HBNB_MYSQL_POOL_MAX_OVERFLOW', '10')),
+            pool_timeout=float(getenv('HBNB_MYSQL_POOL_TIMEOUT', '30')),
+            pool_recycle=int(getenv('HBNB_MYSQL_POOL_RECYCLE', '3600')),
+            pool_pre_ping=getenv('HBNB_MYSQL_POOL_PRE_PING', '1') == '1')
 
     def all(self, cls=None):
         """query on the current database session"""
@@ -52,15 +81,45 @@ class DBStorage:
     def new(self, obj):
         """add the object to the current database session"""
         self.__session.add(obj)
+        self.__cache.pop(obj.__class__.__name__ + '.' + str(obj.id))
+
+    def bulk_new(self, objs):
+        """add every object of objs to the current database session, then
+        commit them all in a single transaction"""
+        self.__session.add_all(objs)
+        for obj in objs:
+            self.__cache.pop(obj.__class__.__name__ + '.' + str(obj.id))
+        self.save()
 
     def save(self):
-        """commit all changes of the current database session"""
-        self.__session.commit()
+        """commit all changes of the current database session, rolled back
+        if the commit fails so that the session remains usable"""
+        changed = [obj.__class__.__name__ + '.' + str(obj.id) for obj in
+                   self.__session.new | self.__session.dirty |
+                   self.__session.deleted]
+        try:
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        for key in changed:
+            self.__cache.pop(key)
+
+    def flush(self):
+        """waits until the saved changes are written; nothing to do here
+        since save() commits them before returning"""
+        pass
+
+    def touch(self, obj):
+        """flags obj as changed; nothing to do here since the session tracks
+        the changes of mapped attributes and only flushes dirty objects"""
+        pass
 
     def delete(self, obj=None):
         """delete from the current database session obj if not None"""
         if obj is not None:
             self.__session.delete(obj)
+            self.__cache.pop(obj.__class__.__name__ + '.' + str(obj.id))
 
     def reload(self):
         """reloads data from the database"""
@@ -77,16 +136,140 @@ class DBStorage:
         """ Obtains an object from the storage by its class and ID.
 
        Arguments:
-            cls (class): class of the object.
+            cls (str, class): name or class of the object.
             id (str, int, uuid.UUID): ID of the object.
         """
 
         if cls and id:
-            for obj in self.all(eval(cls)).values():
-                if obj.id == id:
-                    return obj
+            if isinstance(cls, str):
+                cls = classes.get(cls)
+            if cls is not None:
+                return self.__cached_get(cls, str(id))
         return None
 
+    def __cached_get(self, cls, id):
+        """ Returns the object of cls with the given ID from the session,
+        else rebuilt from the cache, else queried from the database. """
+        obj = self.__session.identity_map.get(identity_key(cls, id))
+        if obj is not None:
+            return obj
+        key = cls.__name__ + '.' + id
+        record = self.__cache.get(key)
+        if record is not None:
+            obj = cls(**record)
+            make_transient_to_detached(obj)
+            return self.__session.merge(obj, load=False)
+        # an object changed by another thread while it is queried must not
+        # be cached as it was before, hence the generation read beforehand
+        generation = self.__cache.generation
+        obj = self.__session.get(cls, id)
+        if obj is not None:
+            self.__cache.put(key, obj.to_dict(), generation)
+        return obj
+
+    def metrics(self):
+        """ Returns a dictionary of counters describing the storage usage:
+        the cache of get() and the connection pool, whose wait times are
+        in seconds. """
+        metrics = {}
+        for prefix, source in (("cache_", self.__cache),
+                               ("pool_", self.__engine.pool)):
+            if hasattr(source, "metrics"):
+                for name, value in source.metrics().items():
+                    metrics[prefix + name] = value
+        return metrics
+
+    def filter(self, cls, **equalities):
+        """ Returns a dictionary of the objects of cls whose columns are
+        equal to the given values, selected by a WHERE clause. """
+        new_dict = {}
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is not None:
+            for obj in self.__query(cls, **equalities):
+                new_dict[obj.__class__.__name__ + '.' + obj.id] = obj
+        return new_dict
+
+    def related(self, cls, relation):
+        """ Returns a dictionary mapping each object of cls to the list of
+        the objects of its relation, eagerly loaded in a second query
+        instead of one query per object. """
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None:
+            return {}
+        query = self.__session.query(cls).options(
+            selectinload(getattr(cls, relation)))
+        return {obj: list(getattr(obj, relation)) for obj in query}
+
+    def iter(self, cls, **equalities):
+        """ Yields one at a time the objects of cls whose columns are equal
+        to the given values, fetching the rows in batches. """
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is not None:
+            yield from self.__query(cls, **equalities).yield_per(100)
+
+    def page(self, cls, limit=None, after=None, **equalities):
+        """ Returns a list of at most limit objects of cls whose columns are
+        equal to the given values, ordered by (created_at, id) and starting
+        after the (created_at, id) position given in after. """
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None:
+            return []
+        query = self.__query(cls, **equalities)
+        if after is not None:
+            created_at, id = after
+            query = query.filter(or_(cls.created_at > created_at,
+                                     and_(cls.created_at == created_at,
+                                          cls.id > id)))
+        query = query.order_by(cls.created_at, cls.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def version(self, cls, **equalities):
+        """ Returns an opaque string that changes whenever an object of cls
+        whose columns are equal to the given values is added, updated or
+        deleted, computed by the database from the number of such objects
+        and their latest update time. """
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None:
+            return ""
+        count, latest = self.__session.query(
+            func.count(cls.id), func.max(cls.updated_at)
+        ).filter_by(**equalities).one()
+        return "{}:{}:{}".format(cls.__name__, count, latest)
+
+    def __query(self, cls, **equalities):
+        """ Returns the query of the objects of cls with a WHERE clause
+        matching each column to its value in equalities. """
+        return self.__session.query(cls).filter_by(**equalities)
+
     def count(self, cls=None):
-        """ Returns the count of the total objects inside the storage. """
-        return len(self.all(cls))
+        """ Returns the count of the total objects inside the storage,
+        computed by the database without loading any object. """
+        if cls is None:
+            return sum(self.counts().values())
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None:
+            return 0
+        return self.__session.query(func.count(cls.id)).scalar()
+
+    def counts(self, names=None):
+        """ Returns a dictionary of the number of objects of each class,
+        fetched in a single query.
+
+        Arguments:
+            names (list): class names to count, all of them by default.
+        """
+        names = [name for name in names or classes if name in classes]
+        if not names:
+            return {}
+        row = self.__session.query(*[
+            self.__session.query(func.count(classes[name].id))
+            .scalar_subquery() for name in names]).one()
+        return dict(zip(names, row))
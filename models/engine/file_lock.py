@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Contains the FileLock class
+"""
+
+from contextlib import contextmanager
+import os
+import threading
+try:
+    import fcntl
+except ImportError:
+    # no advisory locks on this platform, see FileLock.available
+    fcntl = None
+
+
+class FileLock:
+    """advisory lock shared by the processes using the same file, which
+    also holds a few integers, such as generation numbers, read and written
+    while the lock is held
+
+    Each acquisition opens the file again, so two threads of a process
+    exclude each other like two processes do; a thread holding the lock
+    must not acquire it again.
+    """
+
+    # bool - whether the platform provides the advisory locks (fcntl), the
+    # lock raising an ImportError when acquired otherwise
+    available = fcntl is not None
+
+    def __init__(self, path):
+        """Instantiate a FileLock on the file at path, created when first
+        locked"""
+        self.path = path
+        self.__local = threading.local()
+
+    @contextmanager
+    def shared(self):
+        """holds the lock along with the other readers for the duration of
+        a with block"""
+        with self.__locked('LOCK_SH'):
+            yield self
+
+    @contextmanager
+    def exclusive(self):
+        """holds the lock alone for the duration of a with block"""
+        with self.__locked('LOCK_EX'):
+            yield self
+
+    @contextmanager
+    def __locked(self, operation):
+        """opens the file and holds the lock with the flock operation of the
+        given name until the end of a with block"""
+        if not self.available:
+            raise ImportError("file locks need the fcntl module")
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, getattr(fcntl, operation))
+            self.__local.fd = fd
+            yield
+        finally:
+            self.__local.fd = None
+            os.close(fd)
+
+    def read(self, count):
+        """returns the count integers held by the file, zeros if it does
+        not hold them yet; the lock must be held"""
+        os.lseek(self.__local.fd, 0, os.SEEK_SET)
+        numbers = os.read(self.__local.fd, 4096).split()
+        if len(numbers) != count:
+            return (0,) * count
+        return tuple(int(n) for n in numbers)
+
+    def write(self, *numbers):
+        """replaces the integers held by the file; the lock must be held
+        exclusively"""
+        data = " ".join(str(n) for n in numbers).encode() + b"\n"
+        os.lseek(self.__local.fd, 0, os.SEEK_SET)
+        os.write(self.__local.fd, data)
+        os.ftruncate(self.__local.fd, len(data))
@@ -3,10 +3,22 @@
 Contains the FileStorage class
 """
 
-import json
+import atexit
+from contextlib import ExitStack
+from functools import partial
+import heapq
+from operator import attrgetter
+import os
+from os import getenv
+import threading
+from time import monotonic
+from uuid import uuid4
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.file_lock import FileLock
+from models.engine.json_codec import codec
+from models.engine.rw_lock import RWLock
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -14,6 +26,13 @@ from models.user import User
 
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
+# foreign keys indexed by FileStorage for each class, see filter()
+indexes = {"City": ("state_id",), "Place": ("city_id",),
+           "Review": ("place_id",)}
+# related class and foreign key of each relationship, see related()
+relations = {("State", "cities"): ("City", "state_id"),
+             ("City", "places"): ("Place", "city_id"),
+             ("Place", "reviews"): ("Review", "place_id")}
 
 
 class FileStorage:
@@ -21,68 +40,938 @@ class FileStorage:
 
     # string - path to the JSON file
     __file_path = "file.json"
+    # string - path to the journal of the changes made since the JSON file
+    # was last written, one JSON object of {<class name>.id: record} per
+    # save, where a null record stands for a deleted object
+    __journal_path = "file.json.journal"
+    # bool - whether save() appends to the journal instead of rewriting
+    # the JSON file (HBNB_FILE_JOURNAL=1)
+    __journal = getenv("HBNB_FILE_JOURNAL") == "1"
+    # int - number of journaled records after which save() compacts the
+    # journal into a new JSON file (HBNB_FILE_JOURNAL_COMPACT)
+    __compact_after = int(getenv("HBNB_FILE_JOURNAL_COMPACT", "1000"))
+    # int - number of records currently in the journal
+    __journal_records = 0
+    # bool - whether other processes share the JSON file and its journal
+    # (HBNB_FILE_SHARED=1): save() then appends to the journal holding
+    # __file_lock, after replaying the entries appended by the others, and
+    # close() replays them when the generation held by __file_lock changed
+    __shared = getenv("HBNB_FILE_SHARED") == "1"
+    # FileLock - held while the JSON file or the journal is read or written
+    # in shared mode, holding the generation of the store, increased by
+    # each write, and the generation at which the JSON file was written
+    __file_lock = FileLock("file.json.lock")
+    # tuple - the two generations when this process last read or wrote the
+    # store in shared mode
+    __generation = None
+    # int - size of the journal up to the end of its last complete entry, as
+    # last replayed or written; what follows is a torn entry left by an
+    # interrupted write, cut off before the next append
+    __journal_offset = 0
+    # string - directory holding one JSON file per class in sharded mode
+    __shard_dir = "file.d"
+    # bool - whether each class is stored in its own file of __shard_dir,
+    # read on the first access to the class and rewritten only when one of
+    # its objects changed (HBNB_FILE_SHARDED=1); the journal is not used
+    # in sharded mode, which is not available in shared mode
+    __sharded = getenv("HBNB_FILE_SHARDED") == "1" and not __shared
+    # dictionary - (mtime, size, inode) of the file of each class read or
+    # written in sharded mode
+    __shards = {}
+    # bool - whether the files were read, which reload() does on the first
+    # use of the storage rather than when models is imported
+    __started = False
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # dictionary - the same objects partitioned by class name, each class
+    # holding its own {<class name>.id: object} dictionary; __objects is
+    # kept as the merged view of all the partitions
+    __classes = {}
+    # dictionary - secondary indexes by (<class name>, attribute), each one
+    # mapping an attribute value to the keys of the objects holding it
+    __indexes = {}
+    # dictionary - the indexed attribute values of each key, used to find
+    # the entries to drop when an object is re-added or deleted; the values
+    # of a key in __lazy are read from its record instead
+    __indexed = {}
+    # dictionary - keys added, updated or deleted since the last save,
+    # used as an ordered set
+    __pending = {}
+    # dictionary - the last serialized record of each unchanged object, so
+    # save() only calls to_dict() on the objects that changed
+    __records = {}
+    # tuple - (mtime, size, inode) of the JSON file and of the journal when
+    # they were last read or written
+    __stamp = None
+    # dictionary - how many times the JSON file was actually reloaded and
+    # how many times close() found it unchanged and skipped the reload
+    __reloads = {"performed": 0, "skipped": 0}
+    # dictionary - number of changes made to the objects of each class,
+    # combined in version() with a token unique to the running process
+    __versions = {}
+    __token = uuid4().hex
+    # dictionary - keys whose object is still the record read by reload(),
+    # held in __objects and its partition in place of the instance until
+    # it is first accessed, used as an ordered set
+    __lazy = {}
+    # RWLock - held for reading by the methods that only read the objects
+    # and for writing by those that add, delete, save or reload them, so
+    # that the threads of the API never see the dictionaries change under
+    # them; readers return copies of the dictionaries, not the dictionaries
+    __lock = RWLock()
+    # RLock - serializes the few changes made without the write lock:
+    # instantiating reloaded records and counting skipped reloads under the
+    # read lock, and flagging changed objects in touch(), which a write
+    # holds it against
+    __guard = threading.RLock()
+    # bool - whether save() only asks a background thread to write the
+    # changes, which it does once per window of __window seconds whatever
+    # the number of saves asked meanwhile (HBNB_FILE_ASYNC=1), see flush()
+    __async = getenv("HBNB_FILE_ASYNC") == "1"
+    __window = float(getenv("HBNB_FILE_ASYNC_WINDOW", "0.05"))
+    # Thread - the background writer, started by the first asynchronous save
+    __writer = None
+    # Condition - guards the counters of the saves asked and written, and
+    # wakes the writer up
+    __saved = threading.Condition()
+    # dictionary - numbers of saves asked, of saves written so far, of
+    # writes of the file and of saves written along with an earlier one
+    __saves = {"requested": 0, "written": 0, "writes": 0, "coalesced": 0}
+    # int - number of flush() waiting for the writer, which then skips the
+    # rest of its window
+    __flushing = 0
+    # Exception - the error raised by the last background write, if any
+    __write_error = None
+    # Lock - held by save() while it writes the changes, so that writes
+    # encoded and written after releasing __lock are still made in order
+    __writing = threading.Lock()
+    # bool - whether the records gathered under __lock are being encoded
+    # and written, guarded by __saved; reload() waits for the write to end
+    # and close() does not mistake it for a change made by another process
+    __in_flight = False
+
+    def __init__(self):
+        """Instantiate a FileStorage
+
+        Raises an ImportError in shared mode if the platform does not
+        provide the file locks it needs.
+        """
+        if self.__shared and not self.__file_lock.available:
+            raise ImportError("HBNB_FILE_SHARED=1 needs the fcntl module")
 
     def all(self, cls=None):
-        """returns the dictionary __objects"""
+        """returns a copy of the dictionary __objects, or of the partition
+        of cls when a class or class name is given"""
         if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls in (value.__class__, value.__class__.__name__):
-                    new_dict[key] = value
-            return new_dict
-        return self.__objects
+            if not isinstance(cls, str):
+                cls = cls.__name__
+            self.__load(cls)
+            with self.__lock.read():
+                self.__hydrate_all(cls)
+                return dict(self.__classes.get(cls, {}))
+        self.__load()
+        with self.__lock.read():
+            self.__hydrate_all()
+            return dict(self.__objects)
 
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
-            key = obj.__class__.__name__ + "." + obj.id
-            self.__objects[key] = obj
+            with self.__lock.write():
+                self.__load(obj.__class__.__name__)
+                key = obj.__class__.__name__ + "." + obj.id
+                self.__add(key, obj)
+                self.__pending[key] = None
+
+    def bulk_new(self, objs):
+        """sets in __objects every object of objs, then saves them all in a
+        single write of the JSON file or of the journal"""
+        with self.__lock.write():
+            for obj in objs:
+                self.__load(obj.__class__.__name__)
+                key = obj.__class__.__name__ + "." + obj.id
+                self.__add(key, obj)
+                self.__pending[key] = None
+        self.save()
 
     def save(self):
-        """serializes __objects to the JSON file (path: __file_path)"""
+        """serializes __objects to the JSON file (path: __file_path)
+
+        In journal mode only the objects changed since the last save are
+        appended to the journal, until it holds more than __compact_after
+        records and the JSON file is rewritten instead. In sharded mode only
+        the files of the classes of those objects are rewritten.
+
+        In asynchronous mode the background writer is asked to do it and
+        save() returns at once, see flush().
+        """
+        if not self.__async:
+            with self.__saved:
+                self.__saves["requested"] += 1
+                self.__saves["written"] += 1
+            self.__commit()
+            return
+        with self.__saved:
+            self.__saves["requested"] += 1
+            if self.__writer is None:
+                FileStorage.__writer = threading.Thread(
+                    target=self.__write_loop, name="FileStorage writer",
+                    daemon=True)
+                self.__writer.start()
+                atexit.register(self.flush)
+            self.__saved.notify_all()
+
+    def flush(self):
+        """waits until the background writer has written every change
+        saved before the call, without waiting for the end of its window;
+        raises the error of the last write if it failed
+
+        Must not be called while holding the lock of the storage.
+        """
+        with self.__saved:
+            target = self.__saves["requested"]
+            if self.__writer is not None:
+                FileStorage.__flushing += 1
+                self.__saved.notify_all()
+                while self.__saves["written"] < target:
+                    self.__saved.wait()
+                FileStorage.__flushing -= 1
+            error, FileStorage.__write_error = self.__write_error, None
+        if error is not None:
+            raise error
+
+    def __write_loop(self):
+        """writes the saved changes in the background, waiting __window
+        seconds after the first save so that the saves asked meanwhile are
+        written at once"""
+        while True:
+            with self.__saved:
+                while self.__saves["written"] == self.__saves["requested"]:
+                    self.__saved.wait()
+                deadline = monotonic() + self.__window
+                while not self.__flushing and monotonic() < deadline:
+                    self.__saved.wait(deadline - monotonic())
+                target = self.__saves["requested"]
+            try:
+                self.__commit()
+                error = None
+            except Exception as e:
+                error = e
+            with self.__saved:
+                self.__saves["coalesced"] += (target -
+                                              self.__saves["written"] - 1)
+                self.__saves["written"] = target
+                FileStorage.__write_error = error
+                self.__saved.notify_all()
+
+    def __commit(self):
+        """writes the changes made since the last write to the JSON file,
+        the journal or the class files
+
+        Only the records to write are gathered under the lock of the
+        storage; they are encoded and written once it is released, so that
+        the readers do not wait for the file.
+        """
+        self.__start()
+        with self.__writing, ExitStack() as stack:
+            with self.__lock.write(), self.__guard:
+                self.__saves["writes"] += 1
+                if self.__shared:
+                    stack.enter_context(self.__file_lock.exclusive())
+                    self.__refresh()
+                write = self.__prepare()
+                pending = dict(self.__pending)
+                self.__pending.clear()
+                with self.__saved:
+                    FileStorage.__in_flight = True
+            try:
+                if write is not None:
+                    write()
+                stamp = self.__file_stamp()
+                with self.__saved:
+                    FileStorage.__stamp = stamp
+            except Exception:
+                with self.__guard:
+                    for key in pending:
+                        self.__pending[key] = None
+                raise
+            finally:
+                with self.__saved:
+                    FileStorage.__in_flight = False
+                    self.__saved.notify_all()
+
+    def __prepare(self):
+        """gathers the records of the changes made since the last write and
+        returns the function writing them, None if there is nothing to
+        write; the write lock must be held, and __file_lock exclusively in
+        shared mode"""
+        exists = os.path.exists(self.__file_path)
+        records = self.__journal_records + len(self.__pending)
+        if self.__shared and not self.__pending and exists:
+            return None
+        if self.__sharded:
+            return partial(self.__write_shards, {
+                name: self.__serialize(self.__classes.get(name, {}))
+                for name in {key.partition(".")[0]
+                             for key in self.__pending}})
+        if ((self.__journal or self.__shared) and exists and
+                records <= self.__compact_after):
+            write = partial(self.__append_journal, self.__journal_entry())
+            snapshot = False
+        else:
+            write = partial(self.__write_snapshot,
+                            self.__serialize(self.__objects))
+            snapshot = True
+        if self.__shared:
+            return partial(self.__write_shared, write, snapshot)
+        return write
+
+    def __write_shared(self, write, snapshot):
+        """calls write, which appends to the journal shared with the other
+        processes or compacts it into a new JSON file as told by snapshot,
+        then increases the generation of the store; __file_lock must be
+        held exclusively"""
+        write()
+        generation, written = self.__generation
+        if snapshot:
+            written = generation + 1
+        FileStorage.__generation = (generation + 1, written)
+        self.__file_lock.write(*self.__generation)
+
+    def __write_snapshot(self, records):
+        """writes the records of every object to the JSON file and drops
+        the journal"""
+        self.__replace(self.__file_path, codec.dumpb(records))
+        try:
+            os.remove(self.__journal_path)
+        except FileNotFoundError:
+            pass
+        FileStorage.__journal_records = 0
+        FileStorage.__journal_offset = 0
+
+    def __write_shards(self, shards):
+        """writes the records of each class of a {<class name>: records}
+        dictionary to its file in sharded mode"""
+        os.makedirs(self.__shard_dir, exist_ok=True)
+        for name, records in shards.items():
+            path = self.__shard_path(name)
+            self.__replace(path, codec.dumpb(records))
+            self.__shards[name] = self.__path_stamp(path)
+
+    @classmethod
+    def __replace(cls, path, data):
+        """writes data to a temporary file renamed to path, so that path
+        always holds either its former or its new content, even after a
+        crash of the system: both the file and the rename are synced to
+        the disk"""
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        cls.__sync_dir(path)
+
+    @staticmethod
+    def __sync_dir(path):
+        """syncs to the disk the directory holding path, so that a file
+        created or renamed there survives a crash of the system"""
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def __serialize(self, objects):
+        """returns the records of a {<class name>.id: object} dictionary,
+        calling to_dict() only on the objects changed since their last
+        serialization"""
         json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+        for key, obj in objects.items():
+            if key not in self.__records:
+                self.__records[key] = obj.to_dict()
+            json_objects[key] = self.__records[key]
+        return json_objects
+
+    def __journal_entry(self):
+        """returns the records of the objects changed since the last save,
+        None for those deleted"""
+        entry = {}
+        for key in self.__pending:
+            obj = self.__objects.get(key)
+            if obj is not None and key not in self.__records:
+                self.__records[key] = obj.to_dict()
+            entry[key] = self.__records.get(key)
+        return entry
+
+    def __append_journal(self, entry):
+        """appends an entry of changed records to the journal, synced to
+        the disk along with the directory when the journal is created"""
+        if not entry:
+            return
+        self.__trim_journal()
+        created = not os.path.exists(self.__journal_path)
+        with open(self.__journal_path, 'ab') as f:
+            f.write(codec.dumpb(entry) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+            FileStorage.__journal_offset = f.tell()
+        if created:
+            self.__sync_dir(self.__journal_path)
+        FileStorage.__journal_records += len(entry)
+
+    def __trim_journal(self):
+        """cuts off the journal after its last complete entry, so that a
+        torn entry left by an interrupted write is not merged with the next
+        one; in shared mode __file_lock must be held exclusively"""
+        try:
+            with open(self.__journal_path, 'r+b') as f:
+                if f.seek(0, os.SEEK_END) > self.__journal_offset:
+                    f.truncate(self.__journal_offset)
+        except FileNotFoundError:
+            pass
 
     def reload(self):
-        """deserializes the JSON file to __objects"""
+        """deserializes the JSON file to __objects, then replays the journal
+        on top of it
+
+        The records are kept as they are read and only turned into
+        instances when they are first accessed, see __hydrate().
+
+        In sharded mode the file of each class is only read on the first
+        access to the class, see __load(). The JSON file is moved to one
+        file per class the first time, then renamed to <file>.migrated.
+
+        In shared mode the objects that are no longer in the files are
+        dropped, except those with unsaved changes, which are kept as is.
+
+        A write still being made by save() is waited for first.
+        """
+        with self.__lock.write():
+            with self.__saved:
+                while self.__in_flight:
+                    self.__saved.wait()
+            FileStorage.__started = True
+            self.__reloads["performed"] += 1
+            if self.__shared:
+                with self.__file_lock.shared():
+                    FileStorage.__generation = None
+                    self.__refresh()
+                return
+            if self.__sharded:
+                self.__shards.clear()
+                if (not os.path.isdir(self.__shard_dir) and
+                        os.path.exists(self.__file_path)):
+                    self.__migrate()
+                return
+            self.__read_file()
+
+    def __read_file(self):
+        """deserializes the JSON file and its journal to __objects"""
+        FileStorage.__stamp = self.__file_stamp()
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+            with open(self.__file_path, 'rb') as f:
+                jo = codec.loads(f.read())
+            self.__add_records(jo)
         except (FileNotFoundError, ValueError):
             pass
+        FileStorage.__journal_offset = self.__replay_journal()
+        self.__trim_journal()
+
+    def __refresh(self):
+        """brings __objects up to date with the changes written by the other
+        processes in shared mode, only replaying the new entries of the
+        journal unless the JSON file was written again, and returns whether
+        there were any; __file_lock must be held"""
+        generation = self.__file_lock.read(2)
+        if generation == self.__generation:
+            return False
+        if self.__generation is None or generation[1] != self.__generation[1]:
+            try:
+                with open(self.__file_path, 'rb') as f:
+                    records = codec.loads(f.read())
+            except (FileNotFoundError, ValueError):
+                records = {}
+            for key in [key for key in self.__objects
+                        if key not in records and key not in self.__pending]:
+                self.__remove(key)
+            self.__add_records({key: record for key, record in records.items()
+                                if key not in self.__pending})
+            FileStorage.__journal_offset = self.__replay_journal(
+                0, self.__pending)
+        else:
+            FileStorage.__journal_offset = self.__replay_journal(
+                self.__journal_offset, self.__pending)
+        FileStorage.__generation = generation
+        return True
+
+    def __migrate(self):
+        """moves the objects of the JSON file and of its journal to one file
+        per class"""
+        self.__read_file()
+        self.__write_shards({name: self.__serialize(partition)
+                             for name, partition in self.__classes.items()})
+        os.replace(self.__file_path, self.__file_path + ".migrated")
+        try:
+            os.remove(self.__journal_path)
+        except FileNotFoundError:
+            pass
+
+    def __start(self):
+        """reads the files on the first use of the storage, see reload()"""
+        if not self.__started:
+            with self.__lock.write():
+                if not self.__started:
+                    self.reload()
+
+    def __load(self, name=None):
+        """reads the files on the first use of the storage, then in sharded
+        mode the file of the class named name, of every class by default,
+        unless it was read since the last reload
+
+        The write lock is taken when a file has to be read, so this must
+        not be called while holding the read lock.
+        """
+        self.__start()
+        if not self.__sharded:
+            return
+        names = [name for name in (classes if name is None else (name,))
+                 if name in classes and name not in self.__shards]
+        if not names:
+            return
+        with self.__lock.write():
+            for name in names:
+                if name in self.__shards:
+                    continue
+                path = self.__shard_path(name)
+                self.__shards[name] = self.__path_stamp(path)
+                try:
+                    with open(path, 'rb') as f:
+                        self.__add_records(codec.loads(f.read()))
+                except (FileNotFoundError, ValueError):
+                    pass
+
+    def __shard_path(self, name):
+        """returns the path to the file of the class named name"""
+        return os.path.join(self.__shard_dir, name + ".json")
+
+    def __replay_journal(self, offset=0, keep=()):
+        """applies the entries of the journal following offset to __objects,
+        stopping at the first incomplete one, except to the keys of keep;
+        returns the offset following the last entry applied
+
+        An entry is complete once its line ends with a newline, which is
+        written along with it.
+        """
+        if not offset:
+            FileStorage.__journal_records = 0
+        try:
+            with open(self.__journal_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = codec.loads(line)
+                    except ValueError:
+                        break
+                    for key, record in entry.items():
+                        if key in keep:
+                            continue
+                        if record is not None:
+                            self.__add(key, record, record)
+                        elif key in self.__objects:
+                            self.__remove(key)
+                    FileStorage.__journal_records += len(entry)
+                    offset += len(line)
+        except FileNotFoundError:
+            pass
+        return offset
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
-            key = obj.__class__.__name__ + '.' + obj.id
-            if key in self.__objects:
-                del self.__objects[key]
+            with self.__lock.write():
+                self.__load(obj.__class__.__name__)
+                key = obj.__class__.__name__ + '.' + obj.id
+                if key in self.__objects:
+                    self.__remove(key)
+                    self.__pending[key] = None
+
+    def filter(self, cls, **equalities):
+        """returns a dictionary of the objects of cls whose attributes are
+        equal to the given values, served from a secondary index when one
+        of the attributes is indexed"""
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__load(cls)
+        with self.__lock.read():
+            return self.__filter(cls, **equalities)
+
+    def __filter(self, cls, **equalities):
+        """filter() for the class named cls, the read lock being held"""
+        for attr in indexes.get(cls, ()):
+            if attr in equalities:
+                index = self.__indexes.get((cls, attr), {})
+                keys = index.get(equalities[attr], ())
+                candidates = [self.__hydrate(key) for key in keys
+                              if key in self.__objects]
+                break
+        else:
+            self.__hydrate_all(cls)
+            candidates = self.__classes.get(cls, {}).values()
+        new_dict = {}
+        for obj in candidates:
+            for attr, value in equalities.items():
+                if getattr(obj, attr, None) != value:
+                    break
+            else:
+                new_dict[obj.__class__.__name__ + "." + obj.id] = obj
+        return new_dict
+
+    def touch(self, obj):
+        """flags obj as changed so that the next save() serializes it again
+        and its secondary indexes are brought up to date
+
+        The write lock is only taken when one of the indexed attributes of
+        obj changed, so that setting an attribute does not wait for the
+        readers.
+        """
+        name = obj.__class__.__name__
+        key = "{}.{}".format(name, obj.__dict__.get("id"))
+        if self.__objects.get(key) is not obj:
+            return
+        with self.__guard:
+            self.__records.pop(key, None)
+            self.__pending[key] = None
+            self.__bump(name)
+        values = {attr: getattr(obj, attr, None)
+                  for attr in indexes.get(name, ())}
+        if values and self.__indexed.get(key) != values:
+            with self.__lock.write():
+                if self.__objects.get(key) is obj:
+                    self.__index(key, obj)
+
+    def related(self, cls, relation):
+        """returns a dictionary mapping each object of cls to the list of
+        the objects of its relation, grouped in one pass over them"""
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        child, foreign_key = relations[(cls, relation)]
+        self.__load(child)
+        self.__load(cls)
+        with self.__lock.read():
+            self.__hydrate_all(child)
+            self.__hydrate_all(cls)
+            groups = {}
+            for obj in self.__classes.get(child, {}).values():
+                groups.setdefault(getattr(obj, foreign_key, None),
+                                  []).append(obj)
+            return {obj: groups.get(obj.id, [])
+                    for obj in self.__classes.get(cls, {}).values()}
+
+    def iter(self, cls, **equalities):
+        """yields one at a time the objects of cls whose attributes are
+        equal to the given values
+
+        The read lock is not held between two objects, so the caller may
+        change the storage while iterating; objects deleted meanwhile are
+        skipped.
+        """
+        if equalities:
+            yield from self.filter(cls, **equalities).values()
+            return
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__load(cls)
+        with self.__lock.read():
+            keys = list(self.__classes.get(cls, {}))
+        for key in keys:
+            with self.__lock.read():
+                obj = (self.__hydrate(key)
+                       if key in self.__classes.get(cls, {}) else None)
+            if obj is not None:
+                yield obj
+
+    def page(self, cls, limit=None, after=None, **equalities):
+        """returns a list of at most limit objects of cls whose attributes
+        are equal to the given values, ordered by (created_at, id) and
+        starting after the (created_at, id) position given in after"""
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__load(cls)
+        with self.__lock.read():
+            if equalities:
+                candidates = self.__filter(cls, **equalities).values()
+            else:
+                self.__hydrate_all(cls)
+                candidates = self.__classes.get(cls, {}).values()
+            if after is not None:
+                candidates = (obj for obj in candidates
+                              if (obj.created_at, obj.id) > tuple(after))
+            key = attrgetter("created_at", "id")
+            if limit is None:
+                return sorted(candidates, key=key)
+            return heapq.nsmallest(limit, candidates, key=key)
+
+    def __add(self, key, obj, record=None):
+        """stores obj under key in __objects, its class partition and the
+        secondary indexes, along with its serialized record when known;
+        obj may be the record itself, to be instantiated on first access"""
+        name = key.partition(".")[0]
+        self.__objects[key] = obj
+        self.__classes.setdefault(name, {})[key] = obj
+        self.__index(key, obj)
+        self.__bump(name)
+        if record is None:
+            self.__records.pop(key, None)
+        else:
+            self.__records[key] = record
+        if obj is record:
+            self.__lazy[key] = None
+        else:
+            self.__lazy.pop(key, None)
+
+    def __add_records(self, records):
+        """stores in bulk the records of a {<class name>.id: record}
+        dictionary, to be instantiated on first access"""
+        if self.__objects:
+            for key in records.keys() & self.__objects.keys():
+                self.__unindex(key)
+        partitions = {}
+        for key, record in records.items():
+            name = record["__class__"]
+            partition = partitions.get(name)
+            if partition is None:
+                partition = partitions[name] = {}
+            partition[key] = record
+        self.__objects.update(records)
+        self.__records.update(records)
+        self.__lazy.update(dict.fromkeys(records))
+        for name, partition in partitions.items():
+            self.__classes.setdefault(name, {}).update(partition)
+            self.__bump(name)
+            for attr in indexes.get(name, ()):
+                index = self.__indexes.setdefault((name, attr), {})
+                for key, record in partition.items():
+                    value = record.get(attr)
+                    keys = index.get(value)
+                    if keys is None:
+                        keys = index[value] = {}
+                    keys[key] = None
+
+    def __remove(self, key):
+        """drops key from __objects, its class partition and the secondary
+        indexes"""
+        name = key.partition(".")[0]
+        self.__objects.pop(key)
+        self.__classes.get(name, {}).pop(key, None)
+        self.__unindex(key)
+        self.__records.pop(key, None)
+        self.__lazy.pop(key, None)
+        self.__bump(name)
+
+    def __hydrate(self, key):
+        """returns the object stored under key, instantiating it from its
+        record if it was not accessed since it was reloaded"""
+        if key not in self.__lazy:
+            return self.__objects[key]
+        with self.__guard:
+            obj = self.__objects[key]
+            if key in self.__lazy:
+                values = self.__lazy_values(key)
+                obj = classes[obj["__class__"]](**obj)
+                self.__objects[key] = obj
+                self.__classes[key.partition(".")[0]][key] = obj
+                del self.__lazy[key]
+                if values:
+                    self.__indexed[key] = values
+            return obj
+
+    def __hydrate_all(self, cls=None):
+        """instantiates the objects of the class named cls, of every class
+        by default, that were not accessed since they were reloaded"""
+        if self.__lazy:
+            with self.__guard:
+                keys = (self.__lazy if cls is None
+                        else self.__classes.get(cls, {}))
+                for key in list(keys):
+                    if key in self.__lazy:
+                        self.__hydrate(key)
+
+    def __bump(self, name):
+        """counts a change made to the objects of the class name"""
+        self.__versions[name] = self.__versions.get(name, 0) + 1
+
+    def version(self, cls, **equalities):
+        """returns an opaque string that changes whenever an object of cls
+        is added, updated or deleted; the equalities are accepted for
+        compatibility with DBStorage but the version covers the whole
+        class"""
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__load(cls)
+        with self.__lock.read():
+            return "{}:{}:{}".format(cls, self.__token,
+                                     self.__versions.get(cls, 0))
+
+    def __index(self, key, obj):
+        """adds key to the secondary indexes of the class of obj, read from
+        the record when obj is not instantiated yet"""
+        self.__unindex(key)
+        name = key.partition(".")[0]
+        lazy = type(obj) is dict
+        values = {}
+        for attr in indexes.get(name, ()):
+            values[attr] = obj.get(attr) if lazy else getattr(obj, attr, None)
+            index = self.__indexes.setdefault((name, attr), {})
+            index.setdefault(values[attr], {})[key] = None
+        if values and not lazy:
+            self.__indexed[key] = values
+
+    def __lazy_values(self, key):
+        """returns the indexed attribute values of the record of a key that
+        is still in __lazy"""
+        name = key.partition(".")[0]
+        record = self.__records[key]
+        return {attr: record.get(attr) for attr in indexes.get(name, ())}
+
+    def __unindex(self, key):
+        """removes key from the secondary indexes"""
+        name = key.split(".")[0]
+        if key in self.__lazy:
+            values = self.__lazy_values(key)
+        else:
+            values = self.__indexed.pop(key, {})
+        for attr, value in values.items():
+            index = self.__indexes.get((name, attr), {})
+            keys = index.get(value, {})
+            keys.pop(key, None)
+            if value in index and not keys:
+                del index[value]
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
-        self.reload()
+        """call reload() method for deserializing the JSON file to objects,
+        unless the file is unchanged since it was last read or written
+
+        In sharded mode only the classes whose file changed are read again,
+        on their next access. In shared mode only the changes written by the
+        other processes since the last read are read, see __refresh().
+        """
+        if not self.__started:
+            # nothing was read yet, so nothing can be stale
+            pass
+        elif self.__shared:
+            with self.__file_lock.shared():
+                stale = self.__file_lock.read(2) != self.__generation
+            if stale:
+                with self.__lock.write():
+                    with self.__file_lock.shared():
+                        if self.__refresh():
+                            self.__reloads["performed"] += 1
+                            return
+        elif self.__sharded:
+            with self.__lock.read():
+                stale = [name for name, stamp in list(self.__shards.items())
+                         if self.__path_stamp(self.__shard_path(name)) !=
+                         stamp] if self.__idle() else []
+            if stale:
+                with self.__lock.write():
+                    for name in stale:
+                        self.__shards.pop(name, None)
+                    self.__reloads["performed"] += 1
+                return
+        elif self.__file_stamp() != self.__stamp:
+            with self.__lock.write():
+                if self.__idle() and self.__file_stamp() != self.__stamp:
+                    self.reload()
+                    return
+        with self.__guard:
+            self.__reloads["skipped"] += 1
+
+    def __idle(self):
+        """returns whether save() is not writing records gathered earlier,
+        in which case the files changed since they were last read or
+        written were changed by another process"""
+        with self.__saved:
+            return not self.__in_flight
+
+    def __file_stamp(self):
+        """returns the (mtime, size, inode) of the JSON file and of the
+        journal, None for a file that does not exist"""
+        return (self.__path_stamp(self.__file_path),
+                self.__path_stamp(self.__journal_path))
+
+    @staticmethod
+    def __path_stamp(path):
+        """returns the (mtime, size, inode) of a file, None if it does not
+        exist"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def metrics(self):
+        """returns a dictionary of counters describing the storage usage"""
+        return {"reloads_performed": self.__reloads["performed"],
+                "reloads_skipped": self.__reloads["skipped"],
+                "objects_unhydrated": len(self.__lazy),
+                "shards_loaded": len(self.__shards),
+                "saves_requested": self.__saves["requested"],
+                "saves_pending": (self.__saves["requested"] -
+                                  self.__saves["written"]),
+                "saves_coalesced": self.__saves["coalesced"],
+                "writes_performed": self.__saves["writes"],
+                "generation": (self.__generation[0]
+                               if self.__generation else None)}
 
     def get(self, cls, id):
         """ Obtains an object from the storage by its class and ID.
 
        Arguments:
-            cls (class): class of the object.
+            cls (str, class): name or class of the object.
             id (str, int, uuid.UUID): ID of the object.
         """
 
         if cls and id:
-            for obj in self.all(eval(cls)).values():
-                if obj.id == id:
-                    return obj
+            if not isinstance(cls, str):
+                cls = cls.__name__
+            self.__load(cls)
+            key = cls + "." + str(id)
+            with self.__lock.read():
+                if key in self.__objects:
+                    return self.__hydrate(key)
         return None
 
     def count(self, cls=None):
         """ Returns the count of the total objects inside the storage. """
-        return len(self.all(cls))
+        if cls is None:
+            self.__load()
+            with self.__lock.read():
+                return len(self.__objects)
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__load(cls)
+        with self.__lock.read():
+            return len(self.__classes.get(cls, {}))
+
+    def counts(self, names=None):
+        """ Returns a dictionary of the number of objects of each class.
+
+        Arguments:
+            names (list): class names to count, all of them by default.
+        """
+        names = names or list(classes)
+        for name in names:
+            self.__load(name)
+        with self.__lock.read():
+            return {name: len(self.__classes.get(name, {}))
+                    for name in names}
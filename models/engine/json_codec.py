@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""
+Contains the JSONCodec class and the codec shared by the storage engines,
+the console and the API
+"""
+
+from os import getenv
+
+# backends tried in order when none is requested, the fastest first
+backends = ("orjson", "ujson", "json")
+
+
+class JSONCodec:
+    """encodes and decodes JSON with orjson or ujson when one of them is
+    installed, with the json module of the standard library otherwise"""
+
+    def __init__(self, backend=None):
+        """Instantiate a JSONCodec using the given backend, the fastest one
+        installed by default
+
+        Raises a ValueError if the backend is unknown and an ImportError if
+        it is not installed.
+        """
+        if backend is None:
+            for backend in backends:
+                try:
+                    self.__module = __import__(backend)
+                    break
+                except ImportError:
+                    pass
+        elif backend in backends:
+            self.__module = __import__(backend)
+        else:
+            raise ValueError("unknown JSON backend: {}".format(backend))
+        self.backend = backend
+
+    def dumpb(self, obj, sort_keys=False, default=None):
+        """returns the JSON document of obj encoded in UTF-8, default being
+        called on the objects the backend cannot serialize"""
+        if self.backend == "orjson":
+            option = (self.__module.OPT_PASSTHROUGH_DATETIME |
+                      self.__module.OPT_PASSTHROUGH_DATACLASS)
+            if sort_keys:
+                option |= self.__module.OPT_SORT_KEYS
+            return self.__module.dumps(obj, default=default, option=option)
+        return self.dumps(obj, sort_keys, default).encode()
+
+    def dumps(self, obj, sort_keys=False, default=None):
+        """returns the JSON document of obj, default being called on the
+        objects the backend cannot serialize"""
+        if self.backend == "orjson":
+            return self.dumpb(obj, sort_keys, default).decode()
+        if default is None:
+            return self.__module.dumps(obj, sort_keys=sort_keys)
+        return self.__module.dumps(obj, sort_keys=sort_keys, default=default)
+
+    def loads(self, data):
+        """returns the object of a JSON document given as str or bytes
+
+        Raises a ValueError if the document is invalid.
+        """
+        return self.__module.loads(data)
+
+
+# JSONCodec - the codec used by default, whose backend can be forced with
+# HBNB_JSON_CODEC (orjson, ujson or json)
+codec = JSONCodec(getenv("HBNB_JSON_CODEC"))
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""
+Contains the LRUCache class
+"""
+
+from collections import OrderedDict
+import threading
+from time import monotonic
+
+
+class LRUCache:
+    """size-bounded mapping that evicts its least recently used entries
+
+    Entries older than ttl seconds are dropped when next looked up, which
+    bounds how long a change made by another process goes unnoticed. Each
+    pop() or clear() increases the generation of the cache: a value read
+    from the source before the generation changed may be stale, so put()
+    skips it when given the generation read beforehand.
+    """
+
+    def __init__(self, size, ttl=None):
+        """Instantiate an LRUCache holding at most size entries, each for
+        at most ttl seconds unless ttl is None or 0"""
+        self.size = size
+        self.ttl = ttl or None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generation = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """returns the number of entries in the cache"""
+        return len(self.__entries)
+
+    def get(self, key):
+        """returns the value cached under key, None if there is none or if
+        it expired"""
+        with self.__lock:
+            value, expires = self.__entries.get(key, (None, None))
+            if expires is not None and expires <= monotonic():
+                del self.__entries[key]
+                value = None
+            if value is None:
+                self.misses += 1
+            else:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value, generation=None):
+        """caches value under key, evicting the least recently used entries
+        beyond the size of the cache; does nothing if generation is given
+        and is no longer the generation of the cache"""
+        if self.size <= 0:
+            return
+        with self.__lock:
+            if generation is not None and generation != self.generation:
+                return
+            expires = None if self.ttl is None else monotonic() + self.ttl
+            self.__entries[key] = (value, expires)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key):
+        """drops the entry cached under key, if any"""
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.generation += 1
+
+    def clear(self):
+        """drops every entry of the cache"""
+        with self.__lock:
+            self.__entries.clear()
+            self.generation += 1
+
+    def metrics(self):
+        """returns a dictionary of the counters of the cache"""
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "entries": len(self)}
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""
+Contains the RWLock class
+"""
+
+from contextlib import contextmanager
+import threading
+
+
+class RWLock:
+    """readers-writer lock: any number of threads may hold it for reading
+    or a single thread for writing
+
+    Waiting writers are served before new readers so that a steady flow of
+    reads cannot starve them. A thread holding the lock may acquire it
+    again for reading, and the writing thread may also acquire it again
+    for writing; a reading thread must not try to acquire it for writing.
+    """
+
+    def __init__(self):
+        """Instantiate an RWLock held by no thread"""
+        self.__cond = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__writer = None
+        self.__writes = 0
+        self.__waiting = 0
+        self.__local = threading.local()
+
+    @contextmanager
+    def read(self):
+        """holds the lock for reading for the duration of a with block"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """holds the lock for writing for the duration of a with block"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def acquire_read(self):
+        """waits until no thread writes or waits to write, unless the
+        current thread already holds the lock, then holds it for reading"""
+        depth = getattr(self.__local, "reads", 0)
+        if depth or self.__writer == threading.get_ident():
+            self.__local.reads = depth + 1
+            return
+        with self.__cond:
+            while self.__writer is not None or self.__waiting:
+                self.__cond.wait()
+            self.__readers += 1
+        self.__local.reads = 1
+
+    def release_read(self):
+        """releases the lock held for reading by the current thread"""
+        self.__local.reads -= 1
+        if self.__local.reads or self.__writer == threading.get_ident():
+            return
+        with self.__cond:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__cond.notify_all()
+
+    def acquire_write(self):
+        """waits until no other thread holds the lock, then holds it for
+        writing"""
+        me = threading.get_ident()
+        with self.__cond:
+            if self.__writer == me:
+                self.__writes += 1
+                return
+            self.__waiting += 1
+            try:
+                while self.__writer is not None or self.__readers:
+                    self.__cond.wait()
+            finally:
+                self.__waiting -= 1
+            self.__writer = me
+            self.__writes = 1
+
+    def release_write(self):
+        """releases the lock held for writing by the current thread"""
+        with self.__cond:
+            self.__writes -= 1
+            if not self.__writes:
+                self.__writer = None
+                self.__cond.notify_all()
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""
+Contains the class SQLiteStorage
+"""
+
+from os import getenv
+from sqlalchemy import create_engine, event
+from models.engine.db_storage import DBStorage
+from models.engine.timed_pool import TimedQueuePool
+
+# pragmas run on each new connection: the write-ahead log lets readers
+# work while a transaction is being written, and is only synced to disk
+# at checkpoints in NORMAL mode
+pragmas = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL",
+           "PRAGMA foreign_keys=ON")
+
+
+class SQLiteStorage(DBStorage):
+    """interacts with an embedded SQLite database mapped like the MySQL one
+    (HBNB_TYPE_STORAGE=sqlite)
+
+    The database is the file HBNB_SQLITE_PATH (hbnb.db by default); a
+    connection waits up to HBNB_SQLITE_TIMEOUT seconds for another one to
+    finish writing. The connection pool holds HBNB_SQLITE_POOL_SIZE
+    connections.
+    """
+
+    def _create_engine(self):
+        """returns the engine connected to the SQLite database"""
+        engine = create_engine(
+            'sqlite:///{}'.format(getenv('HBNB_SQLITE_PATH', 'hbnb.db')),
+            connect_args={
+                "check_same_thread": False,
+                "timeout": float(getenv('HBNB_SQLITE_TIMEOUT', '30'))},
+            poolclass=TimedQueuePool,
+            pool_size=int(getenv('HBNB_SQLITE_POOL_SIZE', '5')),
+            max_overflow=10)
+        event.listen(engine, "connect", self.__set_pragmas)
+        return engine
+
+    @staticmethod
+    def __set_pragmas(dbapi_connection, connection_record):
+        """sets the pragmas on a new connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Contains the TimedQueuePool class
+"""
+
+import threading
+from time import perf_counter
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool measuring how long each checkout of a connection waits"""
+
+    def __init__(self, *args, **kwargs):
+        """Instantiate a TimedQueuePool with its counters at zero"""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.__lock = threading.Lock()
+
+    def connect(self):
+        """checks a connection out of the pool, timing the wait for a free
+        connection or for a new one to be opened"""
+        start = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            wait = perf_counter() - start
+            with self.__lock:
+                self.checkouts += 1
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+
+    def metrics(self):
+        """returns a dictionary of the counters of the pool"""
+        with self.__lock:
+            checkouts = self.checkouts
+            wait_total = self.wait_total
+            wait_max = self.wait_max
+        return {"size": self.size(), "checked_out": self.checkedout(),
+                "overflow": max(self.overflow(), 0), "checkouts": checkouts,
+                "wait_mean": wait_total / checkouts if checkouts else 0.0,
+                "wait_max": wait_max}
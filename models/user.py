@@ -3,9 +3,9 @@
 import models
 from models.base_model import BaseModel, Base
 from os import getenv
-import sqlalchemy
-from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
+if models.storage_t == 'db':
+    from sqlalchemy import Column, String
+    from sqlalchemy.orm import relationship
 
 
 class User(BaseModel, Base):
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Contains the TestBatchDocs and TestBatch classes
+"""
+
+from api.v1.app import app
+from api.v1.views import batch
+import inspect
+from models import storage
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import pep8
+import unittest
+
+
+class TestBatchDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the batch module"""
+    def test_pep8_conformance_batch(self):
+        """Test that api/v1/views/batch.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/batch.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_batch(self):
+        """Test tests/test_api/test_v1/test_batch.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_api/test_v1/test_batch.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_batch_module_docstring(self):
+        """Test for the batch.py module docstring"""
+        self.assertIsNot(batch.__doc__, None,
+                         "batch.py needs a docstring")
+        self.assertTrue(len(batch.__doc__) >= 1,
+                        "batch.py needs a docstring")
+
+    def test_create_batch_docstring(self):
+        """Test for the create_batch function docstring"""
+        self.assertIsNot(batch.create_batch.__doc__, None,
+                         "create_batch function needs a docstring")
+        self.assertTrue(len(batch.create_batch.__doc__) >= 1,
+                        "create_batch function needs a docstring")
+
+
+class TestBatch(unittest.TestCase):
+    """Test the batch endpoints of the API"""
+    def setUp(self):
+        """Creates a City, a User and a test client of the API"""
+        self.client = app.test_client()
+        self.state = State(name="Nebraska")
+        self.city = City(name="Omaha", state_id=self.state.id)
+        self.user = User(email="batch@hbnb.io", password="pwd")
+        storage.bulk_new([self.state, self.city, self.user])
+        self.url = "/api/v1/cities/{}/places:batch".format(self.city.id)
+
+    def tearDown(self):
+        """Deletes the objects created by the tests"""
+        places = storage.filter(Place, city_id=self.city.id).values()
+        for obj in list(places) + [self.city, self.state, self.user]:
+            obj = storage.get(obj.__class__, obj.id)
+            if obj is not None:
+                obj.delete()
+        storage.save()
+
+    def test_create_batch(self):
+        """Test that every object of the array is created at once"""
+        items = [{"name": "Loft", "user_id": self.user.id},
+                 {"name": "Barn", "user_id": self.user.id}]
+        response = self.client.post(self.url, json=items)
+        self.assertEqual(response.status_code, 201)
+        created = response.get_json()
+        self.assertEqual([place["name"] for place in created],
+                         ["Loft", "Barn"])
+        for place in created:
+            self.assertEqual(place["city_id"], self.city.id)
+            self.assertEqual(storage.get(Place, place["id"]).name,
+                             place["name"])
+
+    def test_invalid_batch(self):
+        """Test that nothing is created when an object is invalid"""
+        cases = ((400, {"name": "Loft"}),
+                 (400, [{"name": "Loft", "user_id": self.user.id},
+                        {"user_id": self.user.id}]),
+                 (404, [{"name": "Loft", "user_id": "nobody"}]))
+        for status, items in cases:
+            response = self.client.post(self.url, json=items)
+            self.assertEqual(response.status_code, status, items)
+        self.assertEqual(storage.filter(Place, city_id=self.city.id), {})
+        response = self.client.post("/api/v1/cities/nowhere/places:batch",
+                                    json=[])
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""
+Contains the TestEtagsDocs and TestEtags classes
+"""
+
+from api.v1.app import app
+from api.v1.views import etags
+import inspect
+from models import storage
+from models.city import City
+from models.state import State
+import pep8
+import unittest
+
+
+class TestEtagsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the etags module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.etags_f = [func for func in inspect.getmembers(
+            etags, inspect.isfunction) if func[1].__module__ == etags.__name__]
+
+    def test_pep8_conformance_etags(self):
+        """Test that api/v1/views/etags.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/etags.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_etags(self):
+        """Test tests/test_api/test_v1/test_etags.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_api/test_v1/test_etags.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_etags_module_docstring(self):
+        """Test for the etags.py module docstring"""
+        self.assertIsNot(etags.__doc__, None,
+                         "etags.py needs a docstring")
+        self.assertTrue(len(etags.__doc__) >= 1,
+                        "etags.py needs a docstring")
+
+    def test_etags_func_docstrings(self):
+        """Test for the presence of docstrings in etags functions"""
+        for func in self.etags_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} function needs a docstring".format(func[0]))
+
+
+class TestEtags(unittest.TestCase):
+    """Test the conditional GET requests of the API"""
+    def setUp(self):
+        """Creates a State and a test client of the API"""
+        self.client = app.test_client()
+        self.state = State(name="Alaska")
+        self.state.save()
+        self.url = "/api/v1/states/" + self.state.id
+
+    def tearDown(self):
+        """Deletes the State created by setUp and its Cities"""
+        for city in storage.filter(City, state_id=self.state.id).values():
+            city.delete()
+        storage.get(State, self.state.id).delete()
+        storage.save()
+
+    def test_if_none_match(self):
+        """Test that a request holding the ETag of an instance is answered
+        with an empty 304 response"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Alaska")
+        etag = response.headers["ETag"]
+        response = self.client.get(self.url,
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_etag_follows_updates(self):
+        """Test that the ETag of an instance changes when it is updated"""
+        etag = self.client.get(self.url).headers["ETag"]
+        response = self.client.put(self.url, json={"name": "Arizona"})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(self.url,
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Arizona")
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_collection_if_none_match(self):
+        """Test that a request holding the ETag of a collection is answered
+        with a 304 response until the collection changes"""
+        url = self.url + "/cities"
+        etag = self.client.get(url).headers["ETag"]
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        response = self.client.post(url, json={"name": "Juneau"})
+        self.assertEqual(response.status_code, 201)
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([city["name"] for city in response.get_json()],
+                         ["Juneau"])
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""
+Contains the TestListingDocs and TestListing classes
+"""
+
+from api.v1.app import app
+from api.v1.views import listing
+from datetime import datetime, timedelta
+import inspect
+from models import storage
+from models.city import City
+from models.state import State
+import os
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestListingDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the listing module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.listing_f = [func for func in inspect.getmembers(
+            listing, inspect.isfunction)
+            if func[1].__module__ == listing.__name__]
+
+    def test_pep8_conformance_listing(self):
+        """Test that api/v1/views/listing.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/listing.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_listing(self):
+        """Test tests/test_api/test_v1/test_listing.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_api/test_v1/\
+test_listing.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_listing_module_docstring(self):
+        """Test for the listing.py module docstring"""
+        self.assertIsNot(listing.__doc__, None,
+                         "listing.py needs a docstring")
+        self.assertTrue(len(listing.__doc__) >= 1,
+                        "listing.py needs a docstring")
+
+    def test_listing_func_docstrings(self):
+        """Test for the presence of docstrings in listing functions"""
+        for func in self.listing_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} function needs a docstring".format(func[0]))
+
+
+class TestListing(unittest.TestCase):
+    """Test the collection endpoints of the API"""
+    def setUp(self):
+        """Creates a State holding five Cities and a test client of the
+        API, without a default page size"""
+        self.client = app.test_client()
+        self.state = State(name="Montana")
+        self.state.save()
+        start = datetime(2020, 1, 1)
+        self.cities = [City(name="City {}".format(i), state_id=self.state.id,
+                            created_at=start + timedelta(seconds=i))
+                       for i in range(5)]
+        for city in self.cities:
+            storage.new(city)
+        storage.save()
+        self.url = "/api/v1/states/{}/cities".format(self.state.id)
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop("HBNB_API_PAGE_SIZE", None)
+
+    def tearDown(self):
+        """Deletes the objects created by setUp"""
+        for obj in self.cities + [self.state]:
+            obj = storage.get(obj.__class__, obj.id)
+            if obj is not None:
+                obj.delete()
+        storage.save()
+
+    def test_cursor_pagination(self):
+        """Test that following the X-Next-Cursor header lists every
+        instance once, in creation order"""
+        names = []
+        response = self.client.get(self.url + "?limit=2")
+        while True:
+            self.assertEqual(response.status_code, 200)
+            names += [city["name"] for city in response.get_json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            response = self.client.get(self.url, query_string={
+                "limit": 2, "cursor": cursor})
+        self.assertEqual(names, [city.name for city in self.cities])
+
+    def test_invalid_page(self):
+        """Test that an invalid limit or cursor is answered with a 400"""
+        for query in ("limit=0", "limit=x", "cursor=%25"):
+            response = self.client.get(self.url + "?" + query)
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_stream(self):
+        """Test that a listing without a limit is streamed by chunks"""
+        with mock.patch.object(listing, "CHUNK_SIZE", 2):
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.is_streamed)
+            self.assertEqual(sorted(city["id"] for city in
+                                    response.get_json()),
+                             sorted(city.id for city in self.cities))
@@ -5,8 +5,17 @@ Contains the class TestConsoleDocs
 
 import console
 import inspect
+import io
+import json
+import models
+from models.amenity import Amenity
+import os
 import pep8
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
 HBNBCommand = console.HBNBCommand
 
 
@@ -39,3 +48,146 @@ class TestConsoleDocs(unittest.TestCase):
                          "HBNBCommand class needs a docstring")
         self.assertTrue(len(HBNBCommand.__doc__) >= 1,
                         "HBNBCommand class needs a docstring")
+
+
+class TestConsoleImportExport(unittest.TestCase):
+    """Class for testing the import and export commands of the console"""
+    def setUp(self):
+        """Creates a scratch directory for the NDJSON files"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "amenities.ndjson")
+
+    def tearDown(self):
+        """Removes the scratch directory"""
+        self.tmp.cleanup()
+
+    def run_command(self, line):
+        """Runs a console command and returns what it printed"""
+        with mock.patch("sys.stdout", new=io.StringIO()) as output:
+            HBNBCommand().onecmd(line)
+        return output.getvalue().strip()
+
+    def test_import(self):
+        """Test that import creates every record of the file at once"""
+        amenities = [Amenity(name="Amenity{}".format(i)) for i in range(3)]
+        with open(self.path, "w") as f:
+            for amenity in amenities:
+                f.write(json.dumps(amenity.to_dict()) + "\n")
+            f.write("\n")
+        with mock.patch.object(models.storage, "new",
+                               wraps=models.storage.new) as new, \
+                mock.patch.object(models.storage, "save",
+                                  wraps=models.storage.save) as save:
+            self.assertEqual(self.run_command("import Amenity " + self.path),
+                             "3")
+        self.assertEqual(new.call_count, 3)
+        save.assert_called_once()
+        for amenity in amenities:
+            imported = models.storage.get(Amenity, amenity.id)
+            self.assertEqual(imported.name, amenity.name)
+            self.assertEqual(imported.created_at, amenity.created_at)
+
+    def test_import_invalid_record(self):
+        """Test that import creates nothing if a record is invalid"""
+        amenity = Amenity(name="Valid")
+        with open(self.path, "w") as f:
+            f.write(json.dumps(amenity.to_dict()) + "\n")
+            f.write("{not json\n")
+        with mock.patch.object(models.storage, "new") as new:
+            self.assertEqual(self.run_command("import Amenity " + self.path),
+                             "** invalid record on line 2 **")
+        new.assert_not_called()
+        self.assertIsNone(models.storage.get(Amenity, amenity.id))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_import_failed_save(self):
+        """Test that import reports records the storage fails to save"""
+        amenity = Amenity(name="Unsaved")
+        with open(self.path, "w") as f:
+            f.write(json.dumps(amenity.to_dict()) + "\n")
+        self.addCleanup(lambda: models.storage.delete(
+            models.storage.get(Amenity, amenity.id)))
+        with mock.patch.object(models.storage, "save",
+                               side_effect=OSError("disk full")):
+            self.assertEqual(self.run_command("import Amenity " + self.path),
+                             "** records can't be saved **")
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_import_missing_column(self):
+        """Test that import checks the required columns of each record"""
+        with open(self.path, "w") as f:
+            f.write(json.dumps({"id": "nameless"}) + "\n")
+        self.assertEqual(self.run_command("import Amenity " + self.path),
+                         "** name missing on line 1 **")
+        self.assertIsNone(models.storage.get(Amenity, "nameless"))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_import_rejected_records(self):
+        """Test that import rolls back records the database rejects and
+        that the storage remains usable"""
+        amenity = Amenity(name="Existing")
+        amenity.save()
+        existing = amenity.id
+        fresh = Amenity(name="Fresh")
+        with open(self.path, "w") as f:
+            f.write(json.dumps(fresh.to_dict()) + "\n")
+            f.write(json.dumps(dict(amenity.to_dict(), name="Copy")) + "\n")
+        self.assertEqual(self.run_command("import Amenity " + self.path),
+                         "** records can't be saved **")
+        self.assertIsNone(models.storage.get(Amenity, fresh.id))
+        later = Amenity(name="Later")
+        later.save()
+        models.storage.close()
+        self.assertEqual(models.storage.get(Amenity, later.id).name, "Later")
+        self.assertEqual(models.storage.get(Amenity, existing).name,
+                         "Existing")
+
+    def test_export(self):
+        """Test that export writes one JSON object per instance"""
+        amenity = Amenity(name="Exported")
+        amenity.save()
+        count = models.storage.count(Amenity)
+        self.assertEqual(self.run_command("export Amenity " + self.path),
+                         str(count))
+        with open(self.path, "r") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), count)
+        self.assertIn(amenity.to_dict(), records)
+
+    def test_encoding(self):
+        """Test that export and import use UTF-8 whatever the locale"""
+        root = os.path.dirname(os.path.abspath(console.__file__))
+        env = dict(os.environ, LC_ALL="C", PYTHONCOERCECLOCALE="0",
+                   PYTHONUTF8="0")
+        env.pop("HBNB_TYPE_STORAGE", None)
+        prelude = ("import sys; sys.path.insert(0, {!r}); "
+                   "from console import HBNBCommand; "
+                   "from models import storage; "
+                   "from models.amenity import Amenity; ").format(root)
+        for script in ("Amenity(id='cafe', name='Caf\\xe9').save(); "
+                       "HBNBCommand().onecmd('export Amenity {}')",
+                       "storage.delete(storage.get(Amenity, 'cafe')); "
+                       "HBNBCommand().onecmd('import Amenity {}'); "
+                       "print(ascii(storage.get(Amenity, 'cafe').name))"):
+            result = subprocess.run(
+                [sys.executable, "-X", "utf8=0", "-c",
+                 prelude + script.format(self.path)],
+                cwd=self.tmp.name, env=env, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, universal_newlines=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+        with open(self.path, "rb") as f:
+            self.assertIn("Café".encode(), f.read())
+        self.assertEqual(result.stdout.split()[-1], "'Caf\\xe9'")
+
+    def test_errors(self):
+        """Test the messages of the import and export commands"""
+        for command in ("import", "export"):
+            self.assertEqual(self.run_command(command),
+                             "** class name missing **")
+            self.assertEqual(self.run_command(command + " Nope x"),
+                             "** class doesn't exist **")
+            self.assertEqual(self.run_command(command + " Amenity"),
+                             "** file name missing **")
+        missing = os.path.join(self.tmp.name, "missing.ndjson")
+        self.assertEqual(self.run_command("import Amenity " + missing),
+                         "** file can't be read **")
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Contains the class TestImportTime
+"""
+
+import os
+import pep8
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# cumulative import time budgets, in milliseconds, in file storage mode
+budgets = {"console": 150, "api.v1.app": 500}
+
+
+def import_times(module):
+    """imports module in a new interpreter in file storage mode and returns
+    the cumulative import time in microseconds of each module imported,
+    as reported by python -X importtime"""
+    env = dict(os.environ)
+    env.pop("HBNB_TYPE_STORAGE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             "import " + module], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.partition("import time:")[2].split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    """Test the time taken to import the console and the API"""
+    def test_pep8_conformance_test_import_time(self):
+        """Test that tests/test_import_time.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_import_time.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_import_budgets(self):
+        """Test that the console and the API are imported within their
+        budgets, without SQLAlchemy in file storage mode"""
+        for module, budget in budgets.items():
+            with self.subTest(module=module):
+                runs = [import_times(module) for i in range(3)]
+                self.assertFalse("sqlalchemy" in runs[0],
+                                 "{} imports SQLAlchemy".format(module))
+                best = min(times[module] for times in runs) / 1000
+                self.assertLess(best, budget,
+                                "importing {} took {:.0f} ms".format(
+                                    module, best))
+
+    def test_storage_read_on_first_use(self):
+        """Test that importing models does not read the JSON file"""
+        env = dict(os.environ)
+        env.pop("HBNB_TYPE_STORAGE", None)
+        script = ("import models; "
+                  "print(models.storage.metrics()['reloads_performed']); "
+                  "models.storage.count(); "
+                  "print(models.storage.metrics()['reloads_performed'])")
+        result = subprocess.run([sys.executable, "-c", script], cwd=ROOT,
+                                env=env, stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True)
+        self.assertEqual(result.stdout.split(), ["0", "1"])
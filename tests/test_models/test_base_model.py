@@ -1,13 +1,17 @@
 #!/usr/bin/python3
 """Test BaseModel for expected behavior and documentation"""
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import inspect
 import models
+import random
 import pep8 as pycodestyle
 import time
 import unittest
 from unittest import mock
 BaseModel = models.base_model.BaseModel
+format_time = models.base_model.format_time
+parse_time = models.base_model.parse_time
+t_format = models.base_model.time
 module_doc = models.base_model.__doc__
 
 
@@ -158,3 +162,55 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+
+class TestTimeFormat(unittest.TestCase):
+    """Test that parse_time and format_time match strptime and strftime"""
+
+    def datetimes(self):
+        """returns edge case and random naive datetimes"""
+        values = [datetime(2017, 9, 28, 21, 5, 54, 119427),
+                  datetime(2017, 9, 28, 21, 5, 54),
+                  datetime(2000, 2, 29, 0, 0, 0, 1),
+                  datetime(1000, 1, 1), datetime(9999, 12, 31, 23, 59, 59,
+                                                 999999),
+                  datetime.utcnow()]
+        rand = random.Random(89)
+        start = datetime(1970, 1, 1)
+        for i in range(1000):
+            values.append(start + timedelta(
+                seconds=rand.randrange(3 * 10 ** 9),
+                microseconds=rand.randrange(10 ** 6)))
+        return values
+
+    def test_format_time(self):
+        """Test that format_time writes what strftime writes"""
+        for value in self.datetimes():
+            self.assertEqual(format_time(value), value.strftime(t_format))
+        aware = datetime(2017, 9, 28, tzinfo=timezone.utc)
+        self.assertEqual(format_time(aware), aware.strftime(t_format))
+
+    def test_parse_time(self):
+        """Test that parse_time reads what strptime reads"""
+        for value in self.datetimes():
+            string = value.strftime(t_format)
+            self.assertEqual(parse_time(string),
+                             datetime.strptime(string, t_format))
+            self.assertEqual(parse_time(format_time(value)), value)
+        for string in ["2017-09-28T21:05:54.1", "2017-09-28T21:05:54.1194"]:
+            self.assertEqual(parse_time(string),
+                             datetime.strptime(string, t_format))
+
+    def test_parse_time_invalid(self):
+        """Test that parse_time refuses what strptime refuses"""
+        for string in ["", "2017-09-28", "2017-09-28T21:05:54",
+                       "2017-09-28 21:05:54.119427",
+                       "2017-13-28T21:05:54.119427",
+                       "2017-09-28T21:05:54.11942Z",
+                       "2017-W39-4T21:05:54.119427",
+                       "2017-09-28T21:05:54.119427+00:00"]:
+            with self.subTest(string=string):
+                with self.assertRaises(ValueError):
+                    datetime.strptime(string, t_format)
+                with self.assertRaises(ValueError):
+                    parse_time(string)
@@ -19,6 +19,7 @@ import json
 import os
 import pep8
 import unittest
+from unittest import mock
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity, "City": City, "Place": Place,
            "Review": Review, "State": State, "User": User}
@@ -112,6 +113,167 @@ class TestMethodsDBStorage(unittest.TestCase):
         self.assertEqual(len_all, count)
         self.assertIs(storage.count("User"), 0)
 
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_count_loads_no_objects(self):
+        """Test that count and counts query the database without loading
+        any object in the session"""
+        state = State(name="Kansas")
+        state.save()
+        storage.close()
+        session = storage._DBStorage__session
+        self.assertGreaterEqual(storage.count("State"), 1)
+        counts = storage.counts(["State", "User"])
+        self.assertEqual(counts["State"], storage.count(State))
+        self.assertEqual(counts["User"], storage.count("User"))
+        self.assertEqual(storage.count(), sum(storage.counts().values()))
+        self.assertEqual(len(session.identity_map), 0)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_page_method(self):
+        """Test that page walks the rows by (created_at, id)"""
+        state = State(name="Paged")
+        state.save()
+        cities = [City(name=str(i), state_id=state.id) for i in range(5)]
+        cities.sort(key=lambda city: (city.created_at, city.id))
+        for city in cities:
+            city.save()
+        first = storage.page(City, 2, state_id=state.id)
+        self.assertEqual(first, cities[:2])
+        last = cities[1]
+        rest = storage.page("City", None, (last.created_at, last.id),
+                            state_id=state.id)
+        self.assertEqual(rest, cities[2:])
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_filter_method(self):
+        """Test that filter only returns the rows matching every column"""
+        state = State(name="Filtered")
+        state.save()
+        city = City(name="Reno", state_id=state.id)
+        city.save()
+        City(name="Elko", state_id=state.id).save()
+        self.assertEqual(storage.filter(City, state_id=state.id,
+                                        name="Reno"),
+                         {"City." + city.id: city})
+        self.assertEqual(len(storage.filter("City", state_id=state.id)), 2)
+        self.assertEqual(storage.filter("City", state_id="none"), {})
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_related_method(self):
+        """Test that related loads the cities of every state at once"""
+        state = State(name="Grouped")
+        state.save()
+        city = City(name="Tahoe", state_id=state.id)
+        city.save()
+        storage.close()
+        states = storage.related("State", "cities")
+        self.assertEqual(len(states), storage.count("State"))
+        grouped = [cities for obj, cities in states.items()
+                   if obj.id == state.id]
+        self.assertEqual([obj.id for obj in grouped[0]], [city.id])
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_get_cached(self):
+        """Test that get serves objects of a closed session from the cache
+        until they are saved again"""
+        state = State(name="Cached")
+        state.save()
+        storage.close()
+        storage.get("State", state.id)
+        storage.close()
+        hits = storage.metrics()["cache_hits"]
+        cached = storage.get("State", state.id)
+        self.assertEqual(storage.metrics()["cache_hits"], hits + 1)
+        self.assertEqual(cached.name, "Cached")
+        cached.name = "Renamed"
+        cached.save()
+        storage.close()
+        misses = storage.metrics()["cache_misses"]
+        self.assertEqual(storage.get("State", state.id).name, "Renamed")
+        self.assertEqual(storage.metrics()["cache_misses"], misses + 1)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_get_skips_stale_cache(self):
+        """Test that get does not cache an object saved while it was being
+        queried"""
+        state = State(name="Racing")
+        state.save()
+        storage.close()
+        cache = storage._DBStorage__cache
+        session_get = type(storage._DBStorage__session()).get
+
+        def get_then_save(session, *args, **kwargs):
+            """queries the object, then invalidates it as a save made by
+            another thread meanwhile would"""
+            obj = session_get(session, *args, **kwargs)
+            cache.pop("State." + state.id)
+            return obj
+
+        with mock.patch.object(type(storage._DBStorage__session()), "get",
+                               get_then_save):
+            storage.get("State", state.id)
+        storage.close()
+        misses = storage.metrics()["cache_misses"]
+        storage.get("State", state.id)
+        self.assertEqual(storage.metrics()["cache_misses"], misses + 1)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_iter_method(self):
+        """Test that iter yields the matching rows of a table"""
+        state = State(name="Iterated")
+        state.save()
+        city = City(name="Boise", state_id=state.id)
+        city.save()
+        self.assertEqual(list(storage.iter(City, state_id=state.id)), [city])
+        self.assertEqual(len(list(storage.iter("State"))),
+                         storage.count("State"))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_version_method(self):
+        """Test that version changes when a matching row changes"""
+        state = State(name="Versioned")
+        state.save()
+        before = storage.version(City, state_id=state.id)
+        city = City(name="Boise", state_id=state.id)
+        city.save()
+        added = storage.version("City", state_id=state.id)
+        self.assertNotEqual(before, added)
+        self.assertEqual(storage.version(City, state_id=state.id), added)
+        city.delete()
+        storage.save()
+        self.assertNotEqual(storage.version(City, state_id=state.id), added)
+        self.assertEqual(storage.version(City, state_id=state.id), before)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_metrics_method(self):
+        """Test that metrics reports the cache and the connection pool"""
+        storage.count(State)
+        metrics = storage.metrics()
+        for name in ("cache_hits", "cache_misses", "pool_size",
+                     "pool_checked_out", "pool_overflow", "pool_checkouts",
+                     "pool_wait_mean", "pool_wait_max"):
+            self.assertIn(name, metrics)
+        self.assertGreater(metrics["pool_checkouts"], 0)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_flush_method(self):
+        """Test that flush returns once saved changes are committed"""
+        state = State(name="Flushed")
+        state.save()
+        storage.flush()
+        self.assertIs(storage.get(State, state.id), state)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_bulk_new_method(self):
+        """Test that bulk_new commits every object at once"""
+        states = [State(name=str(i)) for i in range(3)]
+        count = storage.count(State)
+        storage.bulk_new(states)
+        storage.close()
+        self.assertEqual(storage.count(State), count + 3)
+        for state in states:
+            self.assertEqual(storage.get(State, state.id).name, state.name)
+
 
 class TestDBStorage(unittest.TestCase):
     """Test the FileStorage class"""
@@ -16,14 +16,36 @@ from models.review import Review
 from models.state import State
 from models.user import User
 import json
+import multiprocessing
 import os
 import pep8
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
+import uuid
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
 
+def save_shared_states(names, delete_id=None):
+    """saves a State of each name to the store shared with the other
+    processes, one save each, after deleting the State of id delete_id;
+    run in child processes by test_shared_processes"""
+    FileStorage._FileStorage__shared = True
+    FileStorage._FileStorage__compact_after = 5
+    storage.reload()
+    if delete_id is not None:
+        storage.get(State, delete_id).delete()
+        storage.save()
+    for name in names:
+        State(name=name).save()
+
+
 class TestFileStorageDocs(unittest.TestCase):
     """Tests to check the documentation and style of FileStorage class"""
     @classmethod
@@ -88,8 +110,7 @@ class TestMethodsFileStorage(unittest.TestCase):
         os.environ["HBNB_MYSQL_PWD"] = "hbnb_dev_pwd"
         os.environ["HBNB_MYSQL_DB"] = "hbnb_dev_db"
 
-    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
-                     "not testing file storage")
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_get_method(self):
         """Test of the get method"""
         state = State(name="Colorado")
@@ -99,8 +120,17 @@ class TestMethodsFileStorage(unittest.TestCase):
         self.assertIs(state, obj)
         self.assertIs(storage.get("State", "Any id"), None)
 
-    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
-                     "not testing file storage")
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_get_method_by_class(self):
+        """Test that get accepts a class and only matches that class"""
+        city = City(name="Denver")
+        city.save()
+
+        self.assertIs(storage.get(City, city.id), city)
+        self.assertIs(storage.get("State", city.id), None)
+        self.assertIs(storage.get(City, None), None)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_count_method(self):
         """Test of the count method"""
         count = storage.count()
@@ -112,23 +142,35 @@ class TestMethodsFileStorage(unittest.TestCase):
         self.assertEqual(storage.count("State"), len(storage.all("State")))
         self.assertIs(storage.count("User"), 0)
 
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_counts_method(self):
+        """Test of the counts method"""
+        counts = storage.counts(["State", "User"])
+        self.assertEqual(counts, {"State": storage.count("State"),
+                                  "User": storage.count("User")})
+        self.assertEqual(sum(storage.counts().values()), storage.count())
+
 
 class TestFileStorage(unittest.TestCase):
     """Test the FileStorage class"""
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_all_returns_dict(self):
-        """Test that all returns the FileStorage.__objects attr"""
+        """Test that all returns a copy of the FileStorage.__objects attr"""
         storage = FileStorage()
         new_dict = storage.all()
         self.assertEqual(type(new_dict), dict)
-        self.assertIs(new_dict, storage._FileStorage__objects)
+        self.assertEqual(new_dict, storage._FileStorage__objects)
+        new_dict["State.copy"] = State()
+        self.assertNotIn("State.copy", storage._FileStorage__objects)
 
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_new(self):
         """test that new adds an object to the FileStorage.__objects attr"""
         storage = FileStorage()
         save = FileStorage._FileStorage__objects
+        save_classes = FileStorage._FileStorage__classes
         FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
         test_dict = {}
         for key, value in classes.items():
             with self.subTest(key=key, value=value):
@@ -137,7 +179,9 @@ class TestFileStorage(unittest.TestCase):
                 storage.new(instance)
                 test_dict[instance_key] = instance
                 self.assertEqual(test_dict, storage._FileStorage__objects)
+                self.assertEqual(storage.all(key), {instance_key: instance})
         FileStorage._FileStorage__objects = save
+        FileStorage._FileStorage__classes = save_classes
 
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_save(self):
@@ -151,6 +195,7 @@ class TestFileStorage(unittest.TestCase):
         save = FileStorage._FileStorage__objects
         FileStorage._FileStorage__objects = new_dict
         storage.save()
+        storage.flush()
         FileStorage._FileStorage__objects = save
         for key, value in new_dict.items():
             new_dict[key] = value.to_dict()
@@ -158,3 +203,662 @@ class TestFileStorage(unittest.TestCase):
         with open("file.json", "r") as f:
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_close_skips_unchanged_file(self):
+        """Test that close does not reload a file it has just written"""
+        storage = FileStorage()
+        storage.save()
+        before = storage.metrics()
+        storage.close()
+        after = storage.metrics()
+        self.assertEqual(after["reloads_skipped"],
+                         before["reloads_skipped"] + 1)
+        self.assertEqual(after["reloads_performed"],
+                         before["reloads_performed"])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_close_reloads_changed_file(self):
+        """Test that close reloads file.json once it changed on disk"""
+        storage = FileStorage()
+        storage.save()
+        state = State(name="Nevada")
+        with open("file.json", "r") as f:
+            js = json.load(f)
+        js["State." + state.id] = state.to_dict()
+        with open("file.json", "w") as f:
+            json.dump(js, f)
+        before = storage.metrics()
+        storage.close()
+        self.assertEqual(storage.metrics()["reloads_performed"],
+                         before["reloads_performed"] + 1)
+        self.assertIsNot(storage.get("State", state.id), None)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_filter_follows_indexed_attribute(self):
+        """Test that filter tracks foreign keys through new and delete"""
+        storage = FileStorage()
+        state = State(name="Oregon")
+        other = State(name="Utah")
+        city = City(name="Portland", state_id=state.id)
+        storage.new(state)
+        storage.new(other)
+        storage.new(city)
+        self.assertEqual(storage.filter(City, state_id=state.id),
+                         {"City." + city.id: city})
+        self.assertEqual(state.cities, [city])
+        city.state_id = other.id
+        storage.new(city)
+        self.assertEqual(storage.filter("City", state_id=state.id), {})
+        self.assertEqual(other.cities, [city])
+        storage.delete(city)
+        self.assertEqual(other.cities, [])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_filter_unindexed_attribute(self):
+        """Test that filter also matches attributes without an index"""
+        storage = FileStorage()
+        state = State(name="Filtered")
+        storage.new(state)
+        self.assertEqual(storage.filter(State, name="Filtered",
+                                        id=state.id),
+                         {"State." + state.id: state})
+        self.assertEqual(storage.filter(State, name="Nope", id=state.id), {})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_journal(self):
+        """Test that journal mode appends only the changed objects"""
+        storage = FileStorage()
+        storage.save()
+        FileStorage._FileStorage__journal = True
+        try:
+            state = State(name="Idaho")
+            state.save()
+            state.delete()
+            storage.save()
+            with open("file.json.journal", "r") as f:
+                entries = [json.loads(line) for line in f]
+            key = "State." + state.id
+            self.assertEqual(entries, [{key: state.to_dict()}, {key: None}])
+            with open("file.json", "r") as f:
+                self.assertNotIn(key, json.load(f))
+        finally:
+            FileStorage._FileStorage__journal = False
+            storage.save()
+        self.assertFalse(os.path.exists("file.json.journal"))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_syncs_files(self):
+        """Test that the JSON file, the journal and the directory holding
+        them are synced to the disk by save"""
+        storage = FileStorage()
+        storage.save()
+        with mock.patch.object(file_storage.os, "fsync",
+                               wraps=os.fsync) as fsync:
+            storage.save()
+            self.assertEqual(fsync.call_count, 2)
+            FileStorage._FileStorage__journal = True
+            try:
+                state = State(name="Oregon")
+                state.save()
+                self.assertEqual(fsync.call_count, 4)
+                state.delete()
+                storage.save()
+                self.assertEqual(fsync.call_count, 5)
+            finally:
+                FileStorage._FileStorage__journal = False
+                storage.save()
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_reload_replays_journal(self):
+        """Test that reload applies the journal on top of file.json"""
+        storage = FileStorage()
+        kept = State(name="Iowa")
+        gone = State(name="Ohio")
+        storage.new(gone)
+        storage.save()
+        with open("file.json.journal", "w") as f:
+            f.write(json.dumps({"State." + kept.id: kept.to_dict()}) + "\n")
+            f.write(json.dumps({"State." + gone.id: None}) + "\n")
+            f.write('{"State.torn": {"__cla')
+        try:
+            storage.reload()
+            self.assertEqual(storage.get("State", kept.id).name, "Iowa")
+            self.assertIs(storage.get("State", gone.id), None)
+            self.assertIs(storage.get("State", "torn"), None)
+        finally:
+            storage.save()
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_after_torn_journal(self):
+        """Test that a save following a torn journal entry is kept"""
+        storage = FileStorage()
+        storage.save()
+        saved = (FileStorage._FileStorage__journal,
+                 FileStorage._FileStorage__shared)
+        for shared in (False, True):
+            with self.subTest(shared=shared):
+                FileStorage._FileStorage__journal = True
+                FileStorage._FileStorage__shared = shared
+                try:
+                    storage.reload()
+                    first = State(name="Oregon")
+                    first.save()
+                    with open("file.json.journal", "ab") as f:
+                        f.write(b'{"State.torn": {"__cla')
+                    storage.reload()
+                    second = State(name="Nevada")
+                    second.save()
+                    with open("file.json.journal", "rb") as f:
+                        self.assertNotIn(b"State.torn", f.read())
+                    FileStorage._FileStorage__generation = None
+                    storage.reload()
+                    self.assertEqual(storage.get(State, first.id).name,
+                                     "Oregon")
+                    self.assertEqual(storage.get(State, second.id).name,
+                                     "Nevada")
+                finally:
+                    (FileStorage._FileStorage__journal,
+                     FileStorage._FileStorage__shared) = saved
+                    FileStorage._FileStorage__generation = None
+                    storage.save()
+                    if os.path.exists("file.json.lock"):
+                        os.remove("file.json.lock")
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_journal_compaction(self):
+        """Test that a full journal is compacted into file.json"""
+        storage = FileStorage()
+        storage.save()
+        FileStorage._FileStorage__journal = True
+        FileStorage._FileStorage__compact_after = 2
+        try:
+            states = [State(name="Maine") for i in range(3)]
+            for state in states[:2]:
+                state.save()
+            self.assertTrue(os.path.exists("file.json.journal"))
+            states[2].save()
+            self.assertFalse(os.path.exists("file.json.journal"))
+            with open("file.json", "r") as f:
+                js = json.load(f)
+            for state in states:
+                self.assertIn("State." + state.id, js)
+        finally:
+            FileStorage._FileStorage__journal = False
+            FileStorage._FileStorage__compact_after = 1000
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_serializes_changed_objects(self):
+        """Test that save only calls to_dict on the changed objects"""
+        storage = FileStorage()
+        state = State(name="Texas")
+        storage.new(state)
+        storage.save()
+        state.name = "Vermont"
+        to_dict = BaseModel.to_dict
+        with mock.patch.object(BaseModel, "to_dict", autospec=True,
+                               side_effect=to_dict) as mock_to_dict:
+            storage.save()
+        self.assertEqual(mock_to_dict.call_count, 1)
+        with open("file.json", "r") as f:
+            js = json.load(f)
+        self.assertEqual(js["State." + state.id]["name"], "Vermont")
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_setattr_updates_indexes(self):
+        """Test that setting a foreign key moves the object in the index"""
+        storage = FileStorage()
+        before, after = str(uuid.uuid4()), str(uuid.uuid4())
+        city = City(name="Austin", state_id=before)
+        storage.new(city)
+        self.addCleanup(storage.delete, city)
+        city.state_id = after
+        self.assertEqual(storage.filter(City, state_id=before), {})
+        self.assertEqual(storage.filter(City, state_id=after),
+                         {"City." + city.id: city})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_setattr_without_write_lock(self):
+        """Test that setting an attribute only takes the write lock when an
+        indexed attribute of a stored object changes"""
+        storage = FileStorage()
+        city = City(name="Boise", state_id=str(uuid.uuid4()))
+        storage.new(city)
+        self.addCleanup(storage.delete, city)
+        storage.save()
+        lock = FileStorage._FileStorage__lock
+        with mock.patch.object(lock, "acquire_write",
+                               wraps=lock.acquire_write) as acquire_write:
+            City(name="Unstored").name = "Still unstored"
+            city.name = "Eagle"
+            city.state_id = city.state_id
+            self.assertEqual(acquire_write.call_count, 0)
+            city.state_id = str(uuid.uuid4())
+            self.assertEqual(acquire_write.call_count, 1)
+        self.assertIn("City." + city.id, FileStorage._FileStorage__pending)
+        self.assertEqual(storage.filter(City, state_id=city.state_id),
+                         {"City." + city.id: city})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_page(self):
+        """Test that page walks the objects by (created_at, id)"""
+        storage = FileStorage()
+        state = State(name="Paged")
+        cities = [City(name=str(i), state_id=state.id) for i in range(5)]
+        cities.sort(key=lambda city: (city.created_at, city.id))
+        for city in reversed(cities):
+            storage.new(city)
+        first = storage.page(City, 2, state_id=state.id)
+        self.assertEqual(first, cities[:2])
+        last = cities[1]
+        rest = storage.page("City", None, (last.created_at, last.id),
+                            state_id=state.id)
+        self.assertEqual(rest, cities[2:])
+        self.assertEqual(len(storage.page(City, 3)), 3)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_iter(self):
+        """Test that iter yields the matching objects of a class"""
+        storage = FileStorage()
+        state = State(name="Iterated")
+        city = City(name="Boise", state_id=state.id)
+        storage.new(state)
+        storage.new(city)
+        iterator = storage.iter(City, state_id=state.id)
+        self.assertEqual(next(iterator), city)
+        self.assertEqual(list(iterator), [])
+        self.assertIn(state, list(storage.iter("State")))
+        self.assertEqual(len(list(storage.iter(State))),
+                         storage.count(State))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_related(self):
+        """Test that related groups the cities of every state"""
+        storage = FileStorage()
+        state = State(name="Grouped")
+        empty = State(name="Empty")
+        cities = [City(name=str(i), state_id=state.id) for i in range(3)]
+        for obj in [state, empty] + cities:
+            storage.new(obj)
+        states = storage.related(State, "cities")
+        self.assertEqual(states[state], cities)
+        self.assertEqual(states[empty], [])
+        self.assertEqual(len(states), storage.count(State))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_version(self):
+        """Test that version changes with the objects of its class only"""
+        storage = FileStorage()
+        state = State(name="Versioned")
+        before = storage.version(State)
+        storage.new(state)
+        added = storage.version("State")
+        self.assertNotEqual(before, added)
+        city_version = storage.version(City)
+        state.name = "Renamed"
+        self.assertNotEqual(storage.version(State), added)
+        renamed = storage.version(State)
+        self.assertEqual(storage.version(State), renamed)
+        storage.delete(state)
+        self.assertNotEqual(storage.version(State), renamed)
+        self.assertEqual(storage.version(City), city_version)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_bulk_new(self):
+        """Test that bulk_new adds and saves every object in one write"""
+        storage = FileStorage()
+        states = [State(name=str(i)) for i in range(3)]
+        with mock.patch.object(FileStorage, "save") as save:
+            storage.bulk_new(states)
+        save.assert_called_once_with()
+        for state in states:
+            self.assertIs(storage.get(State, state.id), state)
+        storage.save()
+        storage.flush()
+        with open("file.json", "r") as f:
+            js = json.load(f)
+        for state in states:
+            self.assertIn("State." + state.id, js)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_reload_is_lazy(self):
+        """Test that reload only instantiates the objects on first access"""
+        storage = FileStorage()
+        state = State(name="Lazy")
+        city = City(name="Later", state_id=state.id)
+        storage.new(state)
+        storage.new(city)
+        storage.save()
+        storage.reload()
+        self.assertGreaterEqual(storage.metrics()["objects_unhydrated"], 2)
+        with mock.patch.object(State, "__init__") as init:
+            storage.save()
+            storage.count(State)
+        init.assert_not_called()
+        self.assertEqual(storage.count(State), len(storage.all(State)))
+        reloaded = storage.get(State, state.id)
+        self.assertIsInstance(reloaded, State)
+        self.assertEqual(reloaded.created_at, state.created_at)
+        self.assertIs(storage.get(State, state.id), reloaded)
+        cities = storage.filter(City, state_id=state.id)
+        self.assertIsInstance(cities["City." + city.id], City)
+        storage.all()
+        self.assertEqual(storage.metrics()["objects_unhydrated"], 0)
+        for obj in storage.all().values():
+            self.assertNotIsInstance(obj, dict)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_lazy_indexes(self):
+        """Test that the indexes follow objects reloaded lazily"""
+        storage = FileStorage()
+        state = State(name="Indexed")
+        other = State(name="Other")
+        city = City(name="Moved", state_id=state.id)
+        gone = City(name="Gone", state_id=state.id)
+        for obj in (state, other, city, gone):
+            storage.new(obj)
+        storage.save()
+        storage.reload()
+        storage.reload()
+        self.assertEqual(len(storage.filter(City, state_id=state.id)), 2)
+        storage.delete(storage.get(City, gone.id))
+        moved = storage.get(City, city.id)
+        moved.state_id = other.id
+        self.assertEqual(storage.filter(City, state_id=state.id), {})
+        self.assertEqual(storage.filter(City, state_id=other.id),
+                         {"City." + city.id: moved})
+        storage.save()
+        storage.reload()
+        self.assertEqual(list(storage.filter(City, state_id=other.id)),
+                         ["City." + city.id])
+        self.assertIsNone(storage.get(City, gone.id))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_sharded(self):
+        """Test that sharded mode only rewrites the files of changed classes"""
+        storage = FileStorage()
+        FileStorage._FileStorage__sharded = True
+        try:
+            state = State(name="Sharded")
+            review = Review(text="Kept")
+            storage.new(state)
+            storage.new(review)
+            storage.save()
+            for name, obj in (("State", state), ("Review", review)):
+                with open(os.path.join("file.d", name + ".json"), "r") as f:
+                    self.assertIn(name + "." + obj.id, json.load(f))
+            os.remove(os.path.join("file.d", "Review.json"))
+            state.name = "Changed"
+            storage.save()
+            self.assertFalse(os.path.exists("file.d/Review.json"))
+            with open(os.path.join("file.d", "State.json"), "r") as f:
+                record = json.load(f)["State." + state.id]
+            self.assertEqual(record["name"], "Changed")
+        finally:
+            FileStorage._FileStorage__sharded = False
+            FileStorage._FileStorage__shards.clear()
+            shutil.rmtree("file.d", ignore_errors=True)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_reload_sharded(self):
+        """Test that sharded mode migrates file.json and reads each class
+        file on the first access to the class"""
+        storage = FileStorage()
+        state = State(name="Migrated")
+        storage.new(state)
+        storage.save()
+        FileStorage._FileStorage__sharded = True
+        try:
+            storage.reload()
+            self.assertFalse(os.path.exists("file.json"))
+            self.assertTrue(os.path.exists("file.json.migrated"))
+            with open(os.path.join("file.d", "State.json"), "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
+            storage.reload()
+            self.assertEqual(storage.metrics()["shards_loaded"], 0)
+            self.assertEqual(storage.get(State, state.id).name, "Migrated")
+            self.assertEqual(storage.metrics()["shards_loaded"], 1)
+            before = storage.metrics()
+            storage.close()
+            self.assertEqual(storage.metrics()["reloads_skipped"],
+                             before["reloads_skipped"] + 1)
+            other = State(name="Written elsewhere")
+            with open(os.path.join("file.d", "State.json"), "r") as f:
+                js = json.load(f)
+            js["State." + other.id] = other.to_dict()
+            with open(os.path.join("file.d", "State.json"), "w") as f:
+                json.dump(js, f)
+            storage.close()
+            self.assertEqual(storage.metrics()["shards_loaded"], 0)
+            self.assertEqual(storage.get(State, other.id).name,
+                             "Written elsewhere")
+        finally:
+            FileStorage._FileStorage__sharded = False
+            FileStorage._FileStorage__shards.clear()
+            shutil.rmtree("file.d", ignore_errors=True)
+            os.replace("file.json.migrated", "file.json")
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_concurrent_reads_and_writes(self):
+        """Test that threads may read the storage while others add, delete
+        and save objects"""
+        storage = FileStorage()
+        state = State(name="Shared")
+        storage.new(state)
+        storage.save()
+        errors = []
+
+        def writer():
+            try:
+                for i in range(100):
+                    city = City(name="City {}".format(i), state_id=state.id)
+                    storage.new(city)
+                    if i % 10 == 0:
+                        storage.save()
+                    storage.delete(city)
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                for i in range(100):
+                    for obj in storage.all().values():
+                        obj.id
+                    storage.filter(City, state_id=state.id)
+                    storage.page(City, limit=5)
+                    for city in storage.iter(City):
+                        city.name
+                    storage.related(State, "cities")
+                    self.assertIs(storage.get(State, state.id), state)
+                    storage.count()
+                    storage.close()
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=writer) for i in range(4)]
+        threads += [threading.Thread(target=reader) for i in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        storage.save()
+        self.assertEqual(storage.filter(City, state_id=state.id), {})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_save_async(self):
+        """Test that asynchronous saves are written at once by the
+        background writer, at the latest when flush is called"""
+        storage = FileStorage()
+        storage.save()
+        storage.flush()
+        saved = (FileStorage._FileStorage__async,
+                 FileStorage._FileStorage__window)
+        FileStorage._FileStorage__async = True
+        FileStorage._FileStorage__window = 60
+        try:
+            before = storage.metrics()
+            states = [State(name=str(i)) for i in range(3)]
+            for state in states:
+                storage.new(state)
+                storage.save()
+            self.assertEqual(storage.metrics()["saves_pending"], 3)
+            storage.flush()
+            after = storage.metrics()
+            self.assertEqual(after["saves_pending"], 0)
+            self.assertEqual(after["writes_performed"],
+                             before["writes_performed"] + 1)
+            self.assertEqual(after["saves_coalesced"],
+                             before["saves_coalesced"] + 2)
+            with open("file.json", "r") as f:
+                js = json.load(f)
+            for state in states:
+                self.assertIn("State." + state.id, js)
+            self.assertEqual([name for name in os.listdir(".")
+                              if name.endswith(".tmp")], [])
+        finally:
+            (FileStorage._FileStorage__async,
+             FileStorage._FileStorage__window) = saved
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_read_during_write(self):
+        """Test that the storage may be read while save() encodes and writes
+        the file, and that close() does not take the write for a change
+        made by another process"""
+        storage = FileStorage()
+        state = State(name="Written")
+        storage.new(state)
+        self.addCleanup(storage.save)
+        self.addCleanup(storage.delete, state)
+        entered, release = threading.Event(), threading.Event()
+        dumpb = file_storage.codec.dumpb
+
+        def slow_dumpb(*args, **kwargs):
+            entered.set()
+            release.wait(10)
+            return dumpb(*args, **kwargs)
+        results = []
+
+        def reader():
+            results.append(storage.get(State, state.id))
+            results.append(storage.count(State))
+            storage.close()
+        with mock.patch.object(file_storage.codec, "dumpb",
+                               side_effect=slow_dumpb):
+            writer = threading.Thread(target=storage.save)
+            writer.start()
+            try:
+                self.assertTrue(entered.wait(10))
+                before = storage.metrics()["reloads_performed"]
+                thread = threading.Thread(target=reader)
+                thread.start()
+                thread.join(10)
+                self.assertFalse(thread.is_alive())
+            finally:
+                release.set()
+                writer.join()
+        self.assertEqual(results[0], state)
+        self.assertEqual(storage.metrics()["reloads_performed"], before)
+        with open("file.json", "r") as f:
+            self.assertIn("State." + state.id, json.load(f))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_failed_write_keeps_changes(self):
+        """Test that the changes of a write that failed are written by the
+        next save()"""
+        storage = FileStorage()
+        state = State(name="Retried")
+        storage.new(state)
+        self.addCleanup(storage.save)
+        self.addCleanup(storage.delete, state)
+        with mock.patch.object(file_storage.codec, "dumpb",
+                               side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                storage.save()
+        self.assertIn("State." + state.id, FileStorage._FileStorage__pending)
+        storage.save()
+        with open("file.json", "r") as f:
+            self.assertIn("State." + state.id, json.load(f))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_shared_without_file_locks(self):
+        """Test that shared mode is refused where file locks are missing"""
+        lock = FileStorage._FileStorage__file_lock
+        with mock.patch.object(lock, "available", False), \
+                mock.patch.object(FileStorage, "_FileStorage__shared", True):
+            with self.assertRaises(ImportError):
+                FileStorage()
+            with self.assertRaises(ImportError):
+                with lock.exclusive():
+                    pass
+        FileStorage()
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_shared_processes(self):
+        """Test that processes sharing the store keep each other's writes
+        and see them on close"""
+        storage = FileStorage()
+        saved = (FileStorage._FileStorage__shared,
+                 FileStorage._FileStorage__compact_after)
+        FileStorage._FileStorage__shared = True
+        FileStorage._FileStorage__compact_after = 5
+        try:
+            storage.reload()
+            gone = State(name="Deleted elsewhere")
+            gone.save()
+            names = [["P{}-{}".format(i, j) for j in range(10)]
+                     for i in range(4)]
+            processes = [multiprocessing.Process(
+                target=save_shared_states,
+                args=(names[i], gone.id if i == 0 else None))
+                for i in range(4)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(60)
+                self.assertEqual(process.exitcode, 0)
+            storage.close()
+            self.assertIs(storage.get(State, gone.id), None)
+            kept = State(name="Kept")
+            kept.save()
+            storage.reload()
+            found = {state.name for state in storage.all(State).values()}
+            for name in sum(names, ["Kept"]):
+                self.assertIn(name, found)
+            self.assertNotIn("Deleted elsewhere", found)
+            self.assertEqual(storage.metrics()["generation"], 43)
+        finally:
+            (FileStorage._FileStorage__shared,
+             FileStorage._FileStorage__compact_after) = saved
+            FileStorage._FileStorage__generation = None
+            storage.save()
+            for path in ("file.json.journal", "file.json.lock"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_journal_encoding(self):
+        """Test that the journal holds UTF-8 whatever the locale"""
+        root = os.path.dirname(os.path.abspath(models.__path__[0]))
+        env = dict(os.environ, LC_ALL="C", PYTHONCOERCECLOCALE="0",
+                   PYTHONUTF8="0", HBNB_FILE_JOURNAL="1")
+        env.pop("HBNB_TYPE_STORAGE", None)
+        prelude = ("import sys; sys.path.insert(0, {!r}); "
+                   "from models import storage; "
+                   "from models.state import State; ").format(root)
+        with tempfile.TemporaryDirectory() as tmp:
+            for script in ("State(name='x').save(); "
+                           "State(id='cafe', name='Caf\\xe9').save()",
+                           "print(ascii(storage.get(State, 'cafe').name))"):
+                result = subprocess.run(
+                    [sys.executable, "-X", "utf8=0", "-c", prelude + script],
+                    cwd=tmp, env=env, stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE, universal_newlines=True)
+                self.assertEqual(result.returncode, 0, result.stderr)
+            with open(os.path.join(tmp, "file.json.journal"), "rb") as f:
+                self.assertIn("Café".encode(), f.read())
+        self.assertEqual(result.stdout.strip(), "'Caf\\xe9'")
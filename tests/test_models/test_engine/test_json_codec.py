@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+"""
+Contains the TestJSONCodecDocs and TestJSONCodec classes
+"""
+
+from datetime import datetime
+import inspect
+import json
+from models.engine import json_codec
+import pep8
+import unittest
+JSONCodec = json_codec.JSONCodec
+
+
+def installed(backend):
+    """returns whether the module of a JSON backend can be imported"""
+    try:
+        __import__(backend)
+    except ImportError:
+        return False
+    return True
+
+
+class TestJSONCodecDocs(unittest.TestCase):
+    """Tests to check the documentation and style of JSONCodec class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.codec_f = inspect.getmembers(JSONCodec, inspect.isfunction)
+
+    def test_pep8_conformance_json_codec(self):
+        """Test that models/engine/json_codec.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/json_codec.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_json_codec(self):
+        """Test tests/test_models/test_engine/test_json_codec.py conforms to
+        PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_json_codec.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_json_codec_module_docstring(self):
+        """Test for the json_codec.py module docstring"""
+        self.assertIsNot(json_codec.__doc__, None,
+                         "json_codec.py needs a docstring")
+        self.assertTrue(len(json_codec.__doc__) >= 1,
+                        "json_codec.py needs a docstring")
+
+    def test_json_codec_class_docstring(self):
+        """Test for the JSONCodec class docstring"""
+        self.assertIsNot(JSONCodec.__doc__, None,
+                         "JSONCodec class needs a docstring")
+        self.assertTrue(len(JSONCodec.__doc__) >= 1,
+                        "JSONCodec class needs a docstring")
+
+    def test_json_codec_func_docstrings(self):
+        """Test for the presence of docstrings in JSONCodec methods"""
+        for func in self.codec_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestJSONCodec(unittest.TestCase):
+    """Test the JSONCodec class with every installed backend"""
+    record = {"name": "Utah", "id": "1", "number_rooms": 3,
+              "latitude": 37.5, "amenity_ids": ["a", "b"], "text": None}
+
+    def codecs(self):
+        """returns a codec for each installed backend"""
+        return [JSONCodec(backend) for backend in json_codec.backends
+                if installed(backend)]
+
+    def test_default_backend(self):
+        """Test that the fastest installed backend is used by default"""
+        expected = [backend for backend in json_codec.backends
+                    if installed(backend)][0]
+        self.assertEqual(JSONCodec().backend, expected)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is refused"""
+        with self.assertRaises(ValueError):
+            JSONCodec("pickle")
+
+    def test_round_trip(self):
+        """Test that every backend decodes what any backend encodes"""
+        for codec in self.codecs():
+            document = codec.dumps(self.record)
+            self.assertIs(type(document), str)
+            self.assertEqual(json.loads(document), self.record)
+            self.assertEqual(codec.loads(document), self.record)
+            self.assertEqual(codec.loads(codec.dumpb(self.record)),
+                             self.record)
+            self.assertEqual(codec.loads(json.dumps(self.record)),
+                             self.record)
+
+    def test_sort_keys_and_default(self):
+        """Test that keys can be sorted and unknown types converted"""
+        for codec in self.codecs():
+            document = codec.dumps({"b": 1, "a": datetime(2017, 1, 1)},
+                                   sort_keys=True, default=str)
+            self.assertEqual(json.loads(document),
+                             {"a": "2017-01-01 00:00:00", "b": 1})
+            self.assertLess(document.index('"a"'), document.index('"b"'))
+
+    def test_invalid_document(self):
+        """Test that an invalid document raises a ValueError"""
+        for codec in self.codecs():
+            with self.assertRaises(ValueError):
+                codec.loads('{"name": ')
+
+    @unittest.skipIf(not installed("orjson"), "orjson is not installed")
+    def test_orjson(self):
+        """Test that orjson is used when requested"""
+        codec = JSONCodec("orjson")
+        self.assertEqual(codec.backend, "orjson")
+        self.assertEqual(codec.dumpb([1]), b"[1]")
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+"""
+Contains the TestLRUCacheDocs and TestLRUCache classes
+"""
+
+import inspect
+from models.engine import lru_cache
+import pep8
+import unittest
+from unittest import mock
+LRUCache = lru_cache.LRUCache
+
+
+class TestLRUCacheDocs(unittest.TestCase):
+    """Tests to check the documentation and style of LRUCache class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.lru_f = inspect.getmembers(LRUCache, inspect.isfunction)
+
+    def test_pep8_conformance_lru_cache(self):
+        """Test that models/engine/lru_cache.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/lru_cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_lru_cache(self):
+        """Test tests/test_models/test_engine/test_lru_cache.py conforms to
+        PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_lru_cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_lru_cache_module_docstring(self):
+        """Test for the lru_cache.py module docstring"""
+        self.assertIsNot(lru_cache.__doc__, None,
+                         "lru_cache.py needs a docstring")
+        self.assertTrue(len(lru_cache.__doc__) >= 1,
+                        "lru_cache.py needs a docstring")
+
+    def test_lru_cache_class_docstring(self):
+        """Test for the LRUCache class docstring"""
+        self.assertIsNot(LRUCache.__doc__, None,
+                         "LRUCache class needs a docstring")
+        self.assertTrue(len(LRUCache.__doc__) >= 1,
+                        "LRUCache class needs a docstring")
+
+    def test_lru_func_docstrings(self):
+        """Test for the presence of docstrings in LRUCache methods"""
+        for func in self.lru_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test the LRUCache class"""
+    def test_get_counts_hits_and_misses(self):
+        """Test that get returns cached values and counts the lookups"""
+        cache = LRUCache(2)
+        cache.put("State.1", {"name": "Utah"})
+        self.assertEqual(cache.get("State.1"), {"name": "Utah"})
+        self.assertIs(cache.get("State.2"), None)
+        self.assertEqual(cache.metrics(), {"hits": 1, "misses": 1,
+                                           "evictions": 0, "entries": 1})
+
+    def test_put_evicts_least_recently_used(self):
+        """Test that put evicts the entry that was used the longest ago"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIs(cache.get("b"), None)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_pop_and_clear(self):
+        """Test that pop and clear drop entries"""
+        cache = LRUCache(3)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        self.assertIs(cache.get("a"), None)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self):
+        """Test that a cache of size 0 never holds anything"""
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        self.assertIs(cache.get("a"), None)
+
+    def test_ttl(self):
+        """Test that entries expire ttl seconds after they were put"""
+        cache = LRUCache(2, ttl=10)
+        with mock.patch.object(lru_cache, "monotonic", return_value=100):
+            cache.put("a", 1)
+        with mock.patch.object(lru_cache, "monotonic", return_value=109):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch.object(lru_cache, "monotonic", return_value=110):
+            self.assertIs(cache.get("a"), None)
+        self.assertEqual(len(cache), 0)
+
+    def test_put_skips_stale_generation(self):
+        """Test that put skips a value read before an invalidation"""
+        cache = LRUCache(2)
+        generation = cache.generation
+        cache.pop("a")
+        cache.put("a", 1, generation)
+        self.assertIs(cache.get("a"), None)
+        cache.put("a", 2, cache.generation)
+        self.assertEqual(cache.get("a"), 2)
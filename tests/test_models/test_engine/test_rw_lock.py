@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Contains the TestRWLockDocs and TestRWLock classes
+"""
+
+import inspect
+from models.engine import rw_lock
+import pep8
+import threading
+import time
+import unittest
+RWLock = rw_lock.RWLock
+
+
+class TestRWLockDocs(unittest.TestCase):
+    """Tests to check the documentation and style of RWLock class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.rw_f = inspect.getmembers(RWLock, inspect.isfunction)
+
+    def test_pep8_conformance_rw_lock(self):
+        """Test that models/engine/rw_lock.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/rw_lock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_rw_lock(self):
+        """Test tests/test_models/test_engine/test_rw_lock.py conforms to
+        PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_rw_lock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_rw_lock_module_docstring(self):
+        """Test for the rw_lock.py module docstring"""
+        self.assertIsNot(rw_lock.__doc__, None,
+                         "rw_lock.py needs a docstring")
+        self.assertTrue(len(rw_lock.__doc__) >= 1,
+                        "rw_lock.py needs a docstring")
+
+    def test_rw_lock_class_docstring(self):
+        """Test for the RWLock class docstring"""
+        self.assertIsNot(RWLock.__doc__, None,
+                         "RWLock class needs a docstring")
+        self.assertTrue(len(RWLock.__doc__) >= 1,
+                        "RWLock class needs a docstring")
+
+    def test_rw_func_docstrings(self):
+        """Test for the presence of docstrings in RWLock methods"""
+        for func in self.rw_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestRWLock(unittest.TestCase):
+    """Test the RWLock class"""
+    def run_thread(self, target):
+        """runs target in a thread and returns the thread once started"""
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        return thread
+
+    def test_readers_share_the_lock(self):
+        """Test that a thread may read while another thread reads"""
+        lock = RWLock()
+        entered = threading.Event()
+
+        def reader():
+            with lock.read():
+                entered.set()
+        with lock.read():
+            self.run_thread(reader)
+            self.assertTrue(entered.wait(5))
+
+    def test_writer_excludes_readers(self):
+        """Test that no thread reads while another thread writes"""
+        lock = RWLock()
+        entered = threading.Event()
+
+        def reader():
+            with lock.read():
+                entered.set()
+        with lock.write():
+            thread = self.run_thread(reader)
+            self.assertFalse(entered.wait(0.1))
+        self.assertTrue(entered.wait(5))
+        thread.join(5)
+
+    def test_waiting_writer_goes_before_new_readers(self):
+        """Test that a waiting writer is served before readers arriving
+        after it"""
+        lock = RWLock()
+        order = []
+
+        def writer():
+            with lock.write():
+                order.append("writer")
+
+        def reader():
+            with lock.read():
+                order.append("reader")
+        with lock.read():
+            threads = [self.run_thread(writer)]
+            time.sleep(0.1)
+            threads.append(self.run_thread(reader))
+            time.sleep(0.1)
+            self.assertEqual(order, [])
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(order, ["writer", "reader"])
+
+    def test_reentrant(self):
+        """Test that the writing thread may read and write again, and a
+        reading thread read again while a writer waits"""
+        lock = RWLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        written = threading.Event()
+
+        def writer():
+            with lock.write():
+                written.set()
+        with lock.read():
+            thread = self.run_thread(writer)
+            time.sleep(0.1)
+            with lock.read():
+                self.assertFalse(written.is_set())
+        self.assertTrue(written.wait(5))
+        thread.join(5)
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""
+Contains the TestSQLiteStorageDocs and TestSQLiteStorage classes
+"""
+
+import inspect
+import models
+from models.engine import sqlite_storage
+import os
+import pep8
+from sqlalchemy import inspect as sa_inspect, text
+import tempfile
+import unittest
+from unittest import mock
+SQLiteStorage = sqlite_storage.SQLiteStorage
+
+
+class TestSQLiteStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of SQLiteStorage class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.sqlite_f = inspect.getmembers(SQLiteStorage, inspect.isfunction)
+
+    def test_pep8_conformance_sqlite_storage(self):
+        """Test that models/engine/sqlite_storage.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_sqlite_storage(self):
+        """Test tests/test_models/test_engine/test_sqlite_storage.py conforms
+        to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_sqlite_storage_module_docstring(self):
+        """Test for the sqlite_storage.py module docstring"""
+        self.assertIsNot(sqlite_storage.__doc__, None,
+                         "sqlite_storage.py needs a docstring")
+        self.assertTrue(len(sqlite_storage.__doc__) >= 1,
+                        "sqlite_storage.py needs a docstring")
+
+    def test_sqlite_storage_class_docstring(self):
+        """Test for the SQLiteStorage class docstring"""
+        self.assertIsNot(SQLiteStorage.__doc__, None,
+                         "SQLiteStorage class needs a docstring")
+        self.assertTrue(len(SQLiteStorage.__doc__) >= 1,
+                        "SQLiteStorage class needs a docstring")
+
+    def test_sqlite_func_docstrings(self):
+        """Test for the presence of docstrings in SQLiteStorage methods"""
+        for func in self.sqlite_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Test the SQLiteStorage class"""
+    def test_create_engine_pragmas(self):
+        """Test that the connections to the database file use the WAL and
+        enforce the foreign keys"""
+        path = os.path.join(tempfile.mkdtemp(), "hbnb.db")
+        with mock.patch.dict(os.environ, {"HBNB_SQLITE_PATH": path}):
+            engine = SQLiteStorage.__new__(SQLiteStorage)._create_engine()
+        try:
+            with engine.connect() as connection:
+                self.assertEqual(connection.execute(
+                    text("PRAGMA journal_mode")).scalar(), "wal")
+                self.assertEqual(connection.execute(
+                    text("PRAGMA foreign_keys")).scalar(), 1)
+            self.assertTrue(os.path.exists(path))
+        finally:
+            engine.dispose()
+
+    @unittest.skipIf(not isinstance(models.storage, SQLiteStorage),
+                     "not testing sqlite storage")
+    def test_foreign_keys_indexed(self):
+        """Test that the foreign keys of the tables are indexed"""
+        inspector = sa_inspect(models.storage._DBStorage__engine)
+        for table, column in (("cities", "state_id"), ("places", "city_id"),
+                              ("places", "user_id"),
+                              ("reviews", "place_id"),
+                              ("reviews", "user_id")):
+            indexed = [index["column_names"]
+                       for index in inspector.get_indexes(table)]
+            self.assertIn([column], indexed)
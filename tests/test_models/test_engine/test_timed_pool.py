@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Contains the TestTimedQueuePoolDocs and TestTimedQueuePool classes
+"""
+
+import inspect
+from models.engine import timed_pool
+import pep8
+from sqlalchemy import create_engine, text
+import unittest
+TimedQueuePool = timed_pool.TimedQueuePool
+
+
+class TestTimedQueuePoolDocs(unittest.TestCase):
+    """Tests to check the documentation and style of TimedQueuePool class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.pool_f = [(name, func) for name, func in
+                      vars(TimedQueuePool).items()
+                      if inspect.isfunction(func)]
+
+    def test_pep8_conformance_timed_pool(self):
+        """Test that models/engine/timed_pool.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/timed_pool.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_timed_pool(self):
+        """Test tests/test_models/test_engine/test_timed_pool.py conforms to
+        PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_timed_pool.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_timed_pool_module_docstring(self):
+        """Test for the timed_pool.py module docstring"""
+        self.assertIsNot(timed_pool.__doc__, None,
+                         "timed_pool.py needs a docstring")
+        self.assertTrue(len(timed_pool.__doc__) >= 1,
+                        "timed_pool.py needs a docstring")
+
+    def test_timed_pool_class_docstring(self):
+        """Test for the TimedQueuePool class docstring"""
+        self.assertIsNot(TimedQueuePool.__doc__, None,
+                         "TimedQueuePool class needs a docstring")
+        self.assertTrue(len(TimedQueuePool.__doc__) >= 1,
+                        "TimedQueuePool class needs a docstring")
+
+    def test_timed_pool_func_docstrings(self):
+        """Test for the presence of docstrings in TimedQueuePool methods"""
+        for func in self.pool_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestTimedQueuePool(unittest.TestCase):
+    """Test the TimedQueuePool class"""
+    def setUp(self):
+        """Creates an engine whose pool holds a single connection"""
+        self.engine = create_engine("sqlite://", poolclass=TimedQueuePool,
+                                    pool_size=1, max_overflow=1)
+
+    def tearDown(self):
+        """Closes the connections of the engine"""
+        self.engine.dispose()
+
+    def test_metrics(self):
+        """Test that the pool counts its checkouts and overflow"""
+        pool = self.engine.pool
+        self.assertIsInstance(pool, TimedQueuePool)
+        self.assertEqual(pool.metrics()["checkouts"], 0)
+        self.assertEqual(pool.metrics()["wait_mean"], 0.0)
+        with self.engine.connect() as first:
+            first.execute(text("SELECT 1"))
+            with self.engine.connect() as second:
+                second.execute(text("SELECT 1"))
+                metrics = pool.metrics()
+                self.assertEqual(metrics["size"], 1)
+                self.assertEqual(metrics["checked_out"], 2)
+                self.assertEqual(metrics["overflow"], 1)
+        metrics = pool.metrics()
+        self.assertEqual(metrics["checked_out"], 0)
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertGreater(metrics["wait_max"], 0)
+        self.assertLessEqual(metrics["wait_mean"], metrics["wait_max"])
+
+    def test_recreate(self):
+        """Test that a recreated pool keeps measuring its checkouts"""
+        pool = self.engine.pool.recreate()
+        self.assertIsInstance(pool, TimedQueuePool)
+        self.assertEqual(pool.metrics()["size"], 1)
+        pool.dispose()